@@ -4,22 +4,22 @@ import asyncio
 import signal
 import sys
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-from types import FrameType, TracebackType
-from typing import Any
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
 
-from dotenv import load_dotenv
 from loguru import logger
 
-from nwws.filters import DuplicateFilter, TestMessageFilter
+from nwws.filters import DuplicateFilter, TestMessageFilter, is_test_message
 from nwws.metrics import MetricRegistry
 from nwws.models import Config
 from nwws.models.events import NoaaPortEventData
-from nwws.outputs import ConsoleOutput, DatabaseOutput, MQTTOutput
+from nwws.outputs import ConsoleOutput, MQTTOutput
 from nwws.pipeline import (
     ErrorHandlingStrategy,
     FilterConfig,
+    Output,
     OutputConfig,
     PipelineBuilder,
     PipelineConfig,
@@ -28,7 +28,7 @@ from nwws.pipeline import (
     PipelineStatsCollector,
     TransformerConfig,
 )
-from nwws.pipeline.errors import PipelineError, PipelineErrorHandler
+from nwws.pipeline.errors import PipelineErrorHandler
 from nwws.receiver import (
     WeatherWire,
     WeatherWireConfig,
@@ -37,28 +37,74 @@ from nwws.receiver import (
 )
 from nwws.transformers import NoaaPortTransformer, XmlTransformer
 from nwws.utils import LoggingConfig, WeatherGeoDataProvider
-from nwws.webserver import WebServer
 
-# Load environment variables from .env file
-load_dotenv(override=True)
+if TYPE_CHECKING:
+    from nwws.webserver import WebServer
 
-# Type alias for signal handlers
-type SignalHandler = Callable[[int, FrameType | None], None]
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
+# Logger carrying the constant context of ingest processing errors
+_ingest_error_logger = logger.bind(processing_stage="ingestion", source="weather-wire-receiver")
+
+# Highest valid TCP port number
+_MAX_PORT = 65535
+
+# Dashboard assets served by the web server, resolved once at import
+_DASHBOARD_DIR = Path(__file__).parent / "webserver" / "dashboard"
+_DASHBOARD_TEMPLATES_DIR = str(_DASHBOARD_DIR / "templates")
+_DASHBOARD_STATIC_DIR = str(_DASHBOARD_DIR / "static")
+
+# Display names used when logging service shutdown
+_SERVICE_LABELS: dict[str, str] = {
+    "receiver": "Receiver",
+    "pipeline": "Pipeline",
+    "web_server": "Web Server",
+}
+
+# Stage for every event entering the pipeline; resolved once instead of per message
+_STAGE_INGEST = PipelineStage.INGEST
+
+# Signals that trigger a graceful shutdown
+_SHUTDOWN_SIGNALS: tuple[signal.Signals, ...] = (signal.SIGINT, signal.SIGTERM)
+
+# How long shutdown waits for queued ingest events to be processed
+_INGEST_DRAIN_TIMEOUT_SECONDS = 5.0
+
+# Log one in every _INGEST_LOG_SAMPLE_RATE ingested messages at INFO level
+_INGEST_LOG_SAMPLE_RATE = 100
+
+# Receiver queue depth is sampled every _QUEUE_MONITOR_INTERVAL_SECONDS and a
+# warning is logged when it grows beyond _QUEUE_WARNING_THRESHOLD messages
+_QUEUE_MONITOR_INTERVAL_SECONDS = 1.0
+_QUEUE_WARNING_THRESHOLD = 10
 
 # Type alias for output configuration factories
 type OutputConfigFactory = Callable[[], dict[str, Any] | None]
 
 
+def _create_database_output(output_id: str = "database", **kwargs: Any) -> Output:
+    """Create a DatabaseOutput, deferring the SQLAlchemy import until it is configured."""
+    from nwws.outputs.database import DatabaseOutput  # noqa: PLC0415
+
+    return DatabaseOutput(output_id, **kwargs)
+
+
 class WeatherWireApp:
     """NWWS Weather Wire Application."""
 
+    # Source shared by every ingested event
+    _INGEST_SOURCE = sys.intern("weather-wire-receiver")
+
     def __init__(self, config: Config) -> None:
         """Initialize the Weather Wire application with configuration.
 
         The application is configured with a weather wire receiver and a processing
         pipeline consisting of filters, transformers, and outputs. The application also
-        sets up signal handlers for graceful shutdown and initializes a web server with
-        dashboard capabilities.
+        initializes a web server with dashboard capabilities. Signal handlers for graceful
+        shutdown are installed on the running event loop when services start.
 
         Args:
             config: The application configuration.
@@ -68,7 +114,18 @@ class WeatherWireApp:
         self.config = config
         self.is_shutting_down = False
         self._shutdown_event = asyncio.Event()
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
+
+        # Ingested events are queued and processed by ingest worker tasks; the bounded
+        # queue applies backpressure to the receiver when the workers fall behind
+        self._ingest_queue: asyncio.Queue[NoaaPortEventData] = asyncio.Queue(
+            maxsize=config.ingest_queue_size
+        )
+        self._ingest_tasks: list[asyncio.Task[None]] = []
+        self._queue_monitor_task: asyncio.Task[None] | None = None
+
+        # Previous handlers for signals installed with signal.signal (Windows only)
+        self._fallback_signal_handlers: dict[signal.Signals, Any] = {}
 
         self.message_error_handler = PipelineErrorHandler(
             strategy=ErrorHandlingStrategy.CIRCUIT_BREAKER,
@@ -81,18 +138,21 @@ class WeatherWireApp:
         # Initialize metric registry for application metrics
         self.metric_registry = MetricRegistry()
 
-        # Initialize web server with dashboard capabilities
-        self.web_server = WebServer(
-            registry=self.metric_registry,
-            geo_provider=WeatherGeoDataProvider(),
-            templates_dir=str(Path(__file__).parent / "webserver" / "dashboard" / "templates"),
-            static_dir=str(Path(__file__).parent / "webserver" / "dashboard" / "static"),
+        # Per-message ingest logging is sampled unless debug logging is enabled
+        self._ingested_count = 0
+        self._messages_ingested = self.metric_registry.get_or_create_counter(
+            "nwws_messages_ingested_total",
+            help_text="Total messages ingested into the processing pipeline",
+        )
+        self._test_messages_dropped = self.metric_registry.get_or_create_counter(
+            "nwws_test_messages_dropped_total",
+            help_text="Total test messages dropped before entering the pipeline",
         )
 
-        # Setup signal handlers for graceful shutdown
-        signal_handler: SignalHandler = self._signal_handler
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # Initialize web server with dashboard capabilities only when it will be served
+        self.web_server: WebServer | None = (
+            self._create_web_server() if config.metric_server else None
+        )
 
         # Create processing pipeline
         self._setup_pipeline()
@@ -100,6 +160,21 @@ class WeatherWireApp:
         # Create Weather Wire receiver
         self._setup_receiver()
 
+    def _create_web_server(self) -> "WebServer":
+        """Create the metrics and dashboard web server.
+
+        The web server package pulls in FastAPI and uvicorn, so it is imported here
+        rather than at module level and never loaded when the metric server is disabled.
+        """
+        from nwws.webserver import WebServer  # noqa: PLC0415
+
+        return WebServer(
+            registry=self.metric_registry,
+            geo_provider=WeatherGeoDataProvider(),
+            templates_dir=_DASHBOARD_TEMPLATES_DIR,
+            static_dir=_DASHBOARD_STATIC_DIR,
+        )
+
     def _setup_receiver(self) -> None:
         """Initialize the Weather Wire receiver with configuration.
 
@@ -166,7 +241,7 @@ class WeatherWireApp:
         )
         builder.output_registry.register(
             "database",
-            factory=DatabaseOutput,
+            factory=_create_database_output,
         )
 
         # Parse configured outputs from environment
@@ -217,18 +292,20 @@ class WeatherWireApp:
 
         The configured outputs are parsed from the environment variable `OUTPUTS` and
         converted to a list of OutputConfig objects. The `OUTPUTS` variable is a comma-separated
-        list of output names, which are used to create the OutputConfig objects.
+        list of output names, which are used to create the OutputConfig objects. Names listed
+        more than once produce a single output, keeping the order of first appearance.
 
         Returns:
             list[OutputConfig]: A list of OutputConfig objects, each representing an output handler.
 
         """
-        output_names = [name.strip().lower() for name in self.config.outputs.split(",")]
+        # Insertion-ordered dict drops repeats such as "console,mqtt,console"
+        output_names = dict.fromkeys(
+            raw_name.strip().lower() for raw_name in self.config.outputs.split(",")
+        )
+        output_names.pop("", None)  # Tolerate stray commas, e.g. "console,mqtt,"
         return [
-            OutputConfig(
-                output_type=output_name,
-                output_id=output_name,
-            )
+            OutputConfig(output_type=output_name, output_id=output_name)
             for output_name in output_names
         ]
 
@@ -237,75 +314,116 @@ class WeatherWireApp:
 
         This function initializes and starts the pipeline, weather wire receiver,
         and optionally the web server based on the provided configuration. Services
-        are started concurrently using asyncio.TaskGroup for better performance and
-        structured concurrency. If any service fails to start, all services are
-        automatically cancelled.
+        are started concurrently using asyncio.TaskGroup so startup takes as long as
+        the slowest service; events are not consumed until run() begins, so the
+        receiver may connect before the pipeline outputs are ready. If any service
+        fails to start, the remaining starts are cancelled and any services that did
+        start are stopped before the error is raised.
+
+        Shutdown signal handlers are registered on the running event loop first so a
+        signal received during startup still triggers a graceful shutdown.
         """
-        async with asyncio.TaskGroup() as tg:
-            # Start pipeline first - pipeline.start() is async
-            tg.create_task(self.pipeline.start())
-
-            # Start weather wire receiver - receiver.start() is now async
-            tg.create_task(self.receiver.start())
-
-            # Start web server if enabled - web_server.start() is async
-            if self.config.metric_server:
-                tg.create_task(
-                    self.web_server.start(
-                        host=self.config.metric_host,
-                        port=self.config.metric_port,
-                        log_level=self.config.log_level,
+        self._install_signal_handlers()
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                # Start pipeline - pipeline.start() is async
+                tg.create_task(self.pipeline.start())
+
+                # Start weather wire receiver - receiver.start() is now async
+                tg.create_task(self.receiver.start())
+
+                # Start web server if enabled - web_server.start() is async
+                if self.web_server is not None:
+                    tg.create_task(
+                        self.web_server.start(
+                            host=self.config.metric_host,
+                            port=self.config.metric_port,
+                            log_level=self.config.log_level,
+                        )
                     )
-                )
+        except BaseException:
+            # __aexit__ is not called when __aenter__ fails, so clean up here
+            await self._cleanup_services()
+            raise
 
     async def _cleanup_services(self) -> None:
-        """Stop all application services concurrently using TaskGroup.
+        """Stop all application services concurrently.
 
         This function stops the weather wire receiver, pipeline, and optionally the web
-        server concurrently using asyncio.TaskGroup for faster shutdown. Individual
+        server concurrently using asyncio.gather for faster shutdown. Individual
         service errors are logged but don't prevent other services from stopping.
         """
-        from collections.abc import Awaitable
+        self._remove_signal_handlers()
+
+        if self._queue_monitor_task is not None:
+            self._queue_monitor_task.cancel()
+            self._queue_monitor_task = None
 
-        shutdown_tasks: list[tuple[str, Awaitable[None]]] = []
+        # Flush queued events through the pipeline before its outputs stop
+        await self._stop_ingest_worker()
 
         # Create shutdown tasks for active services
-        shutdown_tasks.append(("receiver", self.receiver.stop()))
-        shutdown_tasks.append(("pipeline", self.pipeline.stop()))
+        shutdown_tasks: list[tuple[str, Awaitable[None]]] = [
+            ("receiver", self.receiver.stop()),
+            ("pipeline", self.pipeline.stop()),
+        ]
 
-        if self.config.metric_server:
+        if self.web_server is not None:
             shutdown_tasks.append(("web_server", self.web_server.stop()))
 
         # Execute all shutdown tasks concurrently with individual error handling
+        shutdown_timeout = self.config.shutdown_timeout_seconds
+
         async def _shutdown_service(service_name: str, shutdown_coro: Awaitable[None]) -> None:
             try:
-                await shutdown_coro
-                logger.debug("%s stopped successfully", service_name.replace("_", " ").title())
+                async with asyncio.timeout(shutdown_timeout):
+                    await shutdown_coro
+                logger.debug("{} stopped successfully", _SERVICE_LABELS[service_name])
+            except TimeoutError:
+                logger.warning(
+                    "Timed out stopping {}, abandoning it",
+                    _SERVICE_LABELS[service_name],
+                    timeout_seconds=shutdown_timeout,
+                )
             except Exception as e:  # noqa: BLE001
                 logger.error(
-                    "Error stopping %s",
-                    service_name.replace("_", " "),
+                    "Error stopping {}",
+                    _SERVICE_LABELS[service_name],
                     error=str(e),
                     error_type=type(e).__name__,
                 )
 
-        # Use TaskGroup for structured concurrency with individual error handling
-        try:
-            async with asyncio.TaskGroup() as tg:
-                for service_name, shutdown_coro in shutdown_tasks:
-                    tg.create_task(_shutdown_service(service_name, shutdown_coro))
-        except* Exception as eg:  # noqa: BLE001
-            # Log exception group but don't re-raise to prevent masking shutdown issues
-            logger.warning(
-                "Some services encountered errors during shutdown: %d errors", len(eg.exceptions)
+        # _shutdown_service logs and swallows its own errors, so a plain gather is enough
+        # here; a TaskGroup would only add exception group handling for the few services.
+        await asyncio.gather(
+            *(
+                _shutdown_service(service_name, shutdown_coro)
+                for service_name, shutdown_coro in shutdown_tasks
             )
+        )
 
     async def _handle_weather_wire_message(self, weather_message: WeatherWireMessage) -> None:
         """Handle a single WeatherWireMessage.
 
-        Convert the message to an enhanced event by creating an enhanced pipeline event with
-        rich metadata context and processing it through the pipeline with circuit breaker
-        error handling.
+        Convert the message to a pipeline event with _build_pipeline_event and queue it for
+        processing through the pipeline by the ingest workers. When the ingest queue is
+        full this waits for space, applying backpressure to the receiver.
+
+        Test messages are dropped before the event is built; the pipeline's
+        TestMessageFilter still rejects any that reach it by other routes.
+
+        Messages are validated by the receiver, so building the event cannot fail; errors
+        raised while processing it are logged by the ingest worker.
+        """
+        if is_test_message(weather_message.awipsid):
+            self._test_messages_dropped.increment()
+            return
+
+        await self._ingest_queue.put(self._build_pipeline_event(weather_message))
+
+    def _build_pipeline_event(self, weather_message: WeatherWireMessage) -> NoaaPortEventData:
+        """Build an enhanced pipeline event with rich metadata context from a message.
 
         The enhanced event includes the following metadata:
         - `awipsid`: The AWIPS ID of the message
@@ -323,99 +441,142 @@ class WeatherWireApp:
             - `has_delay_stamp`: A boolean indicating whether the message has a delay stamp
             - `ingest_timestamp`: The timestamp when the message was ingested
 
-        The function logs any errors encountered during processing and does not crash.
+        Args:
+            weather_message: The validated message received from the weather wire.
+
+        Returns:
+            NoaaPortEventData: The event ready to be processed by the pipeline.
+
         """
-        try:
-            # Create enhanced initial metadata with rich context
-            pipeline_event = NoaaPortEventData(
-                awipsid=weather_message.awipsid,
-                cccc=weather_message.cccc,
-                id=weather_message.id,
-                issue=weather_message.issue,
-                noaaport=weather_message.noaaport,
-                subject=weather_message.subject,
-                ttaaii=weather_message.ttaaii,
-                delay_stamp=weather_message.delay_stamp,
-                content_type="application/octet-stream",
-                metadata=PipelineEventMetadata(
-                    source="weather-wire-receiver",
-                    stage=PipelineStage.INGEST,
-                    trace_id=f"wr-{weather_message.id}-{int(time.time())}",
-                    custom={
-                        "original_source": "weather_wire",
-                        "message_size_bytes": len(weather_message.noaaport),
-                        "has_delay_stamp": weather_message.delay_stamp is not None,
-                        "ingest_timestamp": time.time(),
-                        "awipsid": weather_message.awipsid,
-                        "cccc": weather_message.cccc,
-                        "ttaaii": weather_message.ttaaii,
-                        "subject": weather_message.subject,
-                    },
-                ),
-            )
+        # Single clock read shared by the metadata timestamp and the trace id
+        now_ns = time.time_ns()
+        now = now_ns / 1_000_000_000
+
+        # Fields reused for the event and its metadata are read once
+        message_id = weather_message.id
+        noaaport = weather_message.noaaport
+        delay_stamp = weather_message.delay_stamp
+
+        return NoaaPortEventData(
+            awipsid=weather_message.awipsid,
+            cccc=weather_message.cccc,
+            id=message_id,
+            issue=weather_message.issue,
+            noaaport=noaaport,
+            subject=weather_message.subject,
+            ttaaii=weather_message.ttaaii,
+            delay_stamp=delay_stamp,
+            content_type="application/octet-stream",
+            metadata=PipelineEventMetadata(
+                timestamp=now,
+                source=self._INGEST_SOURCE,
+                stage=_STAGE_INGEST,
+                trace_id=f"wr-{message_id}-{now_ns}",
+                # Product fields such as awipsid are read from the event itself,
+                # so only values not stored on the event are kept here
+                custom={
+                    "original_source": "weather_wire",
+                    "message_size_bytes": len(noaaport),
+                    "has_delay_stamp": delay_stamp is not None,
+                    "ingest_timestamp": now,
+                },
+            ),
+        )
 
-            # Process the event through the pipeline with circuit breaker error handling
-            await self.message_error_handler.execute_with_retry(
-                stage=PipelineStage.INGEST,
-                stage_id="runtime",
-                event=pipeline_event,
-                operation=self.pipeline.process,
-            )
+    async def _ingest_worker(self) -> None:
+        """Process queued events through the pipeline as soon as they are dequeued.
 
-            # Enhanced logging with metadata context
-            logger.info(
-                "Weather wire message ingested to pipeline",
-                event_id=pipeline_event.metadata.event_id,
-                trace_id=pipeline_event.metadata.trace_id,
-                product_id=pipeline_event.id,
-                subject=pipeline_event.subject,
-                awipsid=pipeline_event.awipsid,
-                cccc=pipeline_event.cccc,
-                message_size_bytes=len(weather_message.noaaport),
-                has_delay_stamp=weather_message.delay_stamp is not None,
-                content_type=pipeline_event.content_type,
-            )
+        The pipeline has no batch entry point, so holding events back to group them
+        would only add latency. Several workers may run concurrently; the queue wakes
+        a single worker per event. Each event runs under the circuit breaker error
+        handler so a failing event is logged and skipped without stopping the worker.
+        """
+        queue = self._ingest_queue
+        execute_with_retry = self.message_error_handler.execute_with_retry
+        process = self.pipeline.process
+        messages_ingested = self._messages_ingested
+
+        while True:
+            pipeline_event = await queue.get()
+            try:
+                await execute_with_retry(
+                    stage=_STAGE_INGEST,
+                    stage_id="runtime",
+                    event=pipeline_event,
+                    operation=process,
+                )
+
+                messages_ingested.increment()
+                self._ingested_count += 1
+                self._log_ingested(pipeline_event)
+
+            except Exception as e:  # noqa: BLE001
+                # Log and continue so one bad event cannot stop the ingest worker;
+                # error_type in the log distinguishes pipeline, data and I/O failures
+                self._log_processing_error(e, pipeline_event, "Failed to process weather message")
+            finally:
+                queue.task_done()
+
+    def _log_ingested(self, pipeline_event: NoaaPortEventData) -> None:
+        """Log an ingested event, sampling at INFO level unless debug logging is enabled."""
+        if LoggingConfig.is_debug_enabled():
+            level = "DEBUG"
+        elif self._ingested_count % _INGEST_LOG_SAMPLE_RATE == 0:
+            level = "INFO"
+        else:
+            return
+
+        # Enhanced logging with metadata context
+        logger.log(
+            level,
+            "Weather wire message ingested to pipeline",
+            event_id=pipeline_event.metadata.event_id,
+            trace_id=pipeline_event.metadata.trace_id,
+            product_id=pipeline_event.id,
+            subject=pipeline_event.subject,
+            awipsid=pipeline_event.awipsid,
+            cccc=pipeline_event.cccc,
+            message_size_bytes=len(pipeline_event.noaaport),
+            has_delay_stamp=pipeline_event.delay_stamp is not None,
+            content_type=pipeline_event.content_type,
+            ingested_total=self._ingested_count,
+        )
+
+    async def _stop_ingest_worker(self) -> None:
+        """Let the ingest workers flush queued events, then cancel them."""
+        tasks = self._ingest_tasks
+        if not tasks:
+            return
+        self._ingest_tasks = []
 
-        except PipelineError as e:
-            # Log pipeline-specific errors but don't crash
-            self._log_processing_error(e, weather_message, "Pipeline processing failed")
-        except (ValueError, TypeError, AttributeError) as e:
-            # Data validation errors - log and continue
-            self._log_processing_error(e, weather_message, "Message validation failed")
-        except (ConnectionError, OSError) as e:
-            # Infrastructure errors
-            self._log_processing_error(
-                e, weather_message, "Infrastructure error processing message"
+        try:
+            await asyncio.wait_for(self._ingest_queue.join(), _INGEST_DRAIN_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning(
+                "Timed out draining ingest queue, dropping pending events",
+                pending_events=self._ingest_queue.qsize(),
             )
-        except Exception as e:  # noqa: BLE001
-            # Log unexpected errors
-            self._log_processing_error(e, weather_message, "Unexpected error processing message")
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     def _log_processing_error(
         self,
         error: Exception,
-        event: WeatherWireMessage,
+        event: NoaaPortEventData,
         message: str,
     ) -> None:
         """Log processing errors with enhanced context and metadata."""
-        event_id = event.id if hasattr(event, "id") else "unknown"
-        subject = event.subject if hasattr(event, "subject") else "unknown"
-        awipsid = event.awipsid if hasattr(event, "awipsid") else "unknown"
-        cccc = event.cccc if hasattr(event, "cccc") else "unknown"
-
-        # Enhanced error logging with additional context
-        error_context = {
-            "error": str(error),
-            "error_type": type(error).__name__,
-            "product_id": event_id,
-            "subject": subject,
-            "awipsid": awipsid,
-            "cccc": cccc,
-            "processing_stage": "ingestion",
-            "source": "weather-wire-receiver",
-        }
-
-        logger.error(message, **error_context)
+        _ingest_error_logger.error(
+            message,
+            error=str(error),
+            error_type=type(error).__name__,
+            product_id=event.id,
+            subject=event.subject,
+            awipsid=event.awipsid,
+            cccc=event.cccc,
+        )
 
     async def __aenter__(self) -> "WeatherWireApp":
         """Async context manager entry point to start application services.
@@ -431,6 +592,13 @@ class WeatherWireApp:
         """
         logger.info("Starting NWWS-OI application services")
         await self._start_services()
+        self._ingest_tasks = [
+            asyncio.create_task(self._ingest_worker(), name=f"ingest-worker-{worker}")
+            for worker in range(self.config.ingest_workers)
+        ]
+        self._queue_monitor_task = asyncio.create_task(
+            self._monitor_receiver_queue(), name="receiver-queue-monitor"
+        )
         logger.info("Started NWWS-OI application services")
         return self
 
@@ -466,22 +634,54 @@ class WeatherWireApp:
             )
             # Don't re-raise cleanup errors to avoid masking original exception
 
-    def _signal_handler(self, signum: int, _frame: FrameType | None) -> None:
+    def _install_signal_handlers(self) -> None:
+        """Register shutdown signal handlers on the running event loop.
+
+        Handlers run as regular event loop callbacks rather than interrupting
+        bytecode execution. Platforms without loop signal support (Windows) fall
+        back to signal.signal handlers that hand the signal to the loop with
+        call_soon_threadsafe.
+        """
+        loop = asyncio.get_running_loop()
+        for signum in _SHUTDOWN_SIGNALS:
+            try:
+                loop.add_signal_handler(signum, self._signal_handler, signum)
+            except NotImplementedError:
+                previous = signal.signal(
+                    signum,
+                    lambda sig, _frame: loop.call_soon_threadsafe(
+                        self._signal_handler, signal.Signals(sig)
+                    ),
+                )
+                self._fallback_signal_handlers[signum] = (
+                    signal.SIG_DFL if previous is None else previous
+                )
+
+    def _remove_signal_handlers(self) -> None:
+        """Remove the shutdown signal handlers from the running event loop."""
+        loop = asyncio.get_running_loop()
+        for signum in _SHUTDOWN_SIGNALS:
+            previous = self._fallback_signal_handlers.pop(signum, None)
+            if previous is not None:
+                signal.signal(signum, previous)
+            else:
+                loop.remove_signal_handler(signum)
+
+    def _signal_handler(self, signum: signal.Signals) -> None:
         """Handle shutdown signals (SIGINT, SIGTERM) gracefully.
 
-        This function is the signal handler for the SIGINT and SIGTERM signals.
+        This function is the event loop callback for the SIGINT and SIGTERM signals.
         When either of these signals is received, it logs a message indicating
         that a shutdown signal was received and initiates a graceful shutdown
         of the NWWS-OI application by calling the shutdown() method.
 
         Args:
-            signum: The signal number received (SIGINT or SIGTERM).
-            _frame: The current stack frame (not used).
+            signum: The signal received (SIGINT or SIGTERM).
 
         """
         logger.info(
             "Received shutdown signal, initiating graceful shutdown",
-            signal=signum,
+            signal=signum.name,
         )
         self.shutdown()
 
@@ -501,14 +701,23 @@ class WeatherWireApp:
         if not config.nwws_server:
             server_error = "XMPP server is required"
             raise ValueError(server_error)
-        if config.nwws_port <= 0 or config.nwws_port > 65535:
-            port_error = f"Invalid port number: {config.nwws_port}. Must be between 1 and 65535"
+        port = config.nwws_port
+        if not 0 < port <= _MAX_PORT:
+            port_error = f"Invalid port number: {port}. Must be between 1 and {_MAX_PORT}"
             raise ValueError(port_error)
 
+        if config.ingest_workers <= 0:
+            workers_error = f"Invalid ingest worker count: {config.ingest_workers}. Must be positive"
+            raise ValueError(workers_error)
+        if config.ingest_queue_size <= 0:
+            queue_error = f"Invalid ingest queue size: {config.ingest_queue_size}. Must be positive"
+            raise ValueError(queue_error)
+
         # Validate metrics server configuration
-        if config.metric_server and (config.metric_port <= 0 or config.metric_port > 65535):
+        metric_port = config.metric_port
+        if config.metric_server and not 0 < metric_port <= _MAX_PORT:
             metrics_port_error = (
-                f"Invalid metrics port: {config.metric_port}. Must be between 1 and 65535"
+                f"Invalid metrics port: {metric_port}. Must be between 1 and {_MAX_PORT}"
             )
             raise ValueError(metrics_port_error)
 
@@ -541,55 +750,87 @@ class WeatherWireApp:
         logger.info(
             "Running NWWS-OI application event loop",
             pipeline_id=self.pipeline.pipeline_id,
-            uptime_seconds=time.time() - self._start_time,
+            uptime_seconds=self.uptime_seconds,
             filters_count=len(self.pipeline.filters),
             has_transformer=self.pipeline.transformer is not None,
             outputs_count=len(self.pipeline.outputs),
         )
 
         try:
-            # Use async iterator to process messages
-            async for weather_message in self.receiver:
-                if self._shutdown_event.is_set():
-                    logger.info("Shutdown event detected, exiting main loop")
-                    break
-                try:
-                    await self._handle_weather_wire_message(weather_message)
-
-                    # Log queue size for monitoring
-                    queue_size = self.receiver.queue_size
-                    if queue_size > 10:  # Log when queue starts building up
-                        logger.warning("Message queue building up: %d messages pending", queue_size)
-                    elif queue_size > 0:
-                        logger.debug("Queue size: %d messages", queue_size)
-
-                except (
-                    PipelineError,
-                    ValueError,
-                    TypeError,
-                    AttributeError,
-                    ConnectionError,
-                    OSError,
-                ) as e:
-                    self._log_processing_error(
-                        e, weather_message, "Error processing weather message"
-                    )
-                except Exception as e:  # noqa: BLE001
-                    self._log_processing_error(
-                        e, weather_message, "Unexpected error processing weather message"
-                    )
+            await self._run_until_shutdown()
         except asyncio.CancelledError:
             logger.info("Application cancelled")
             raise
         except Exception as e:
-            logger.error("Unexpected error in main loop: %s", str(e))
+            logger.error("Unexpected error in main loop: {}", str(e))
             raise
 
         logger.info(
             "NWWS-OI application event loop stopped",
-            uptime_seconds=time.time() - self._start_time,
+            uptime_seconds=self.uptime_seconds,
         )
 
+    async def _run_until_shutdown(self) -> None:
+        """Consume messages until shutdown is requested or a background task fails.
+
+        The receiver is only polled when messages arrive, so the consumer runs as a task
+        that is cancelled as soon as the shutdown event is set rather than waiting for
+        the next message. The ingest workers are watched as well so a crash there ends
+        the run instead of silently stalling ingestion.
+        """
+        consumer = asyncio.create_task(self._consume_messages(), name="weather-wire-consumer")
+        shutdown_waiter = asyncio.create_task(self._shutdown_event.wait(), name="shutdown-waiter")
+        watched = {consumer, shutdown_waiter, *self._ingest_tasks}
+
+        try:
+            done, _ = await asyncio.wait(watched, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            consumer.cancel()
+            shutdown_waiter.cancel()
+            await asyncio.gather(consumer, shutdown_waiter, return_exceptions=True)
+
+        if shutdown_waiter in done:
+            logger.info("Shutdown event detected, exiting main loop")
+
+        for task in done:
+            if task is not shutdown_waiter and not task.cancelled():
+                task.result()  # Re-raise a consumer or ingest worker failure
+
+    async def _consume_messages(self) -> None:
+        """Hand each message from the weather wire receiver to the ingest worker."""
+        handle_message = self._handle_weather_wire_message
+        async for weather_message in self.receiver:
+            # Processing errors are handled per event by the ingest worker
+            await handle_message(weather_message)
+
+    async def _monitor_receiver_queue(self) -> None:
+        """Periodically sample the receiver queue depth for monitoring.
+
+        Sampling runs outside the message loop so consuming a message does no monitoring
+        work. The warning is edge-triggered: it is logged when the backlog first grows
+        beyond _QUEUE_WARNING_THRESHOLD and again only after the queue has recovered.
+        """
+        backlogged = False
+        while True:
+            await asyncio.sleep(_QUEUE_MONITOR_INTERVAL_SECONDS)
+            queue_size = self.receiver.queue_size
+            if queue_size > _QUEUE_WARNING_THRESHOLD:
+                if not backlogged:
+                    logger.warning("Message queue building up", pending_messages=queue_size)
+                    backlogged = True
+                continue
+
+            if backlogged:
+                logger.info("Message queue recovered", pending_messages=queue_size)
+                backlogged = False
+            if queue_size > 0 and LoggingConfig.is_debug_enabled():
+                logger.debug("Receiver queue size", pending_messages=queue_size)
+
+    @property
+    def uptime_seconds(self) -> float:
+        """Seconds since the application was created, from the monotonic clock."""
+        return (time.monotonic_ns() - self._start_ns) / 1_000_000_000
+
     def shutdown(self) -> None:
         """Initiate the shutdown process for the NWWS-OI application.
 
@@ -626,6 +867,14 @@ async def main() -> None:
     Finally, it logs the application shutdown process and exits the process with
     the set exit code.
     """
+    # Load environment variables from .env file
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    load_dotenv(override=True)
+
+    # Run new tasks synchronously until their first await to skip a scheduler pass
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     exit_code = 0
 
     try:
@@ -668,7 +917,8 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # Prefer the libuv based event loop when available
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         logger.info("Application terminated by user")
         sys.exit(0)
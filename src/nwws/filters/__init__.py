@@ -2,6 +2,6 @@
 """Filters package for pipeline event filtering."""
 
 from .duplicate_filter import DuplicateFilter
-from .test_msg_filter import TestMessageFilter
+from .test_msg_filter import TestMessageFilter, is_test_message
 
-__all__ = ["DuplicateFilter", "TestMessageFilter"]
+__all__ = ["DuplicateFilter", "TestMessageFilter", "is_test_message"]
@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
+from nwws.logging_config import LoggingConfig
 from nwws.pipeline.filters import Filter
 
 if TYPE_CHECKING:
@@ -16,12 +18,17 @@ if TYPE_CHECKING:
 type ProductId = str
 type Timestamp = float
 
+# Default for attribute lookups that tells a missing attribute apart from any value
+_MISSING: Any = object()
+
 
 class DuplicateFilter(Filter):
     """Filter that rejects duplicate products within a configurable time window.
 
     Uses the product 'id' field as the key for duplicate detection.
-    Maintains an in-memory cache of recently seen product IDs with timestamps.
+    Maintains an in-memory cache of recently seen product IDs with monotonic
+    timestamps. A product is only recorded when it is not already tracked, so the
+    cache stays in recording order and expiry pops aged-out entries from its front.
 
     Example:
         # Create filter with 5-minute window (default)
@@ -54,7 +61,7 @@ class DuplicateFilter(Filter):
         """
         super().__init__(filter_id)
         self.window_seconds = window_seconds
-        self._seen_products: dict[ProductId, Timestamp] = {}
+        self._seen_products: OrderedDict[ProductId, Timestamp] = OrderedDict()
 
     def should_process(self, event: PipelineEvent) -> bool:
         """Determine if the event should be processed.
@@ -68,11 +75,9 @@ class DuplicateFilter(Filter):
             False if product ID was seen within window, True otherwise.
 
         """
-        # Clean up expired entries before processing
-        self._cleanup_expired_entries()
-
-        # Check if event has an 'id' attribute (product ID)
-        if not hasattr(event, "id"):
+        # Look up the product ID once; the sentinel distinguishes a missing attribute
+        product_id = getattr(event, "id", _MISSING)
+        if product_id is _MISSING:
             logger.warning(
                 "Event missing product id attribute",
                 filter_id=self.filter_id,
@@ -82,7 +87,6 @@ class DuplicateFilter(Filter):
             # Allow events without product ID to pass through
             return True
 
-        product_id = getattr(event, "id", "")
         if not isinstance(product_id, str) or not product_id:
             logger.warning(
                 "Invalid product id",
@@ -93,15 +97,12 @@ class DuplicateFilter(Filter):
             # Allow events with invalid product ID to pass through
             return True
 
-        current_time = time.time()
+        current_time = time.monotonic()
 
-        # Check if we've seen this product ID recently
+        # Once expired entries are dropped, anything still tracked is within the window
+        self._cleanup_expired_entries(current_time)
         if product_id in self._seen_products:
-            last_seen = self._seen_products[product_id]
-            time_since_last = current_time - last_seen
-
-            if time_since_last < self.window_seconds:
-                return False
+            return False
 
         # Record this product ID with current timestamp
         self._seen_products[product_id] = current_time
@@ -122,7 +123,7 @@ class DuplicateFilter(Filter):
             if not result and product_id in self._seen_products:
                 # Event was filtered as duplicate
                 last_seen = self._seen_products[product_id]
-                time_since_last = time.time() - last_seen
+                time_since_last = time.monotonic() - last_seen
                 metadata[f"{self.filter_id}_time_since_last_seconds"] = round(
                     time_since_last, 2
                 )
@@ -134,24 +135,32 @@ class DuplicateFilter(Filter):
 
         return metadata
 
-    def _cleanup_expired_entries(self) -> None:
-        """Remove expired entries from the seen products cache."""
-        current_time = time.time()
-        expired_keys = [
-            product_id
-            for product_id, timestamp in self._seen_products.items()
-            if current_time - timestamp >= self.window_seconds
-        ]
+    def _cleanup_expired_entries(self, current_time: Timestamp) -> None:
+        """Remove expired entries from the seen products cache.
+
+        Entries are kept in recording order, so only the front of the cache
+        needs to be examined; scanning stops at the first unexpired entry.
+
+        Args:
+            current_time: The current time.monotonic() reading.
+
+        """
+        seen_products = self._seen_products
+        window_seconds = self.window_seconds
+        expired_count = 0
 
-        for product_id in expired_keys:
-            del self._seen_products[product_id]
+        while seen_products and current_time - next(iter(seen_products.values())) >= window_seconds:
+            seen_products.popitem(last=False)
+            expired_count += 1
 
-        if expired_keys:
+        # In steady state entries expire about as often as events arrive, so the
+        # record is only built when debug logging is enabled
+        if expired_count and LoggingConfig.is_debug_enabled():
             logger.debug(
                 "Cleaned up expired duplicate tracking entries",
                 filter_id=self.filter_id,
-                expired_count=len(expired_keys),
-                remaining_count=len(self._seen_products),
+                expired_count=expired_count,
+                remaining_count=len(seen_products),
             )
 
     def get_cache_stats(self) -> dict[str, int | float]:
@@ -161,13 +170,11 @@ class DuplicateFilter(Filter):
             Dictionary containing cache statistics.
 
         """
-        current_time = time.time()
+        seen_products = self._seen_products
         return {
-            "total_tracked": len(self._seen_products),
+            "total_tracked": len(seen_products),
             "window_seconds": self.window_seconds,
             "oldest_entry_age": (
-                current_time - min(self._seen_products.values())
-                if self._seen_products
-                else 0.0
+                time.monotonic() - next(iter(seen_products.values())) if seen_products else 0.0
             ),
         }
@@ -10,6 +10,13 @@ from nwws.pipeline.filters import Filter
 if TYPE_CHECKING:
     from nwws.pipeline.types import PipelineEvent
 
+TEST_MESSAGE_AWIPSID = "TSTMSG"
+
+
+def is_test_message(awipsid: str) -> bool:
+    """Return True if the AWIPS ID identifies a test message (case-insensitive)."""
+    return awipsid.upper() == TEST_MESSAGE_AWIPSID
+
 
 class TestMessageFilter(Filter):
     """Filter that rejects test messages with awipsid='TSTMSG'."""
@@ -35,14 +42,11 @@ class TestMessageFilter(Filter):
             False if awipsid is 'TSTMSG', True otherwise.
 
         """
-        if not hasattr(event, "awipsid"):
-            # If no awipsid attribute, allow processing
-            return True
-
-        awipsid = getattr(event, "awipsid", "")
+        # A single lookup; events without an awipsid attribute are allowed through
+        awipsid = getattr(event, "awipsid", None)
 
         # Reject test messages (case-insensitive comparison)
-        return not (isinstance(awipsid, str) and awipsid.upper() == "TSTMSG")
+        return not (isinstance(awipsid, str) and is_test_message(awipsid))
 
     def get_filter_decision_metadata(
         self, event: PipelineEvent, *, result: bool
@@ -55,7 +59,7 @@ class TestMessageFilter(Filter):
             awipsid = getattr(event, "awipsid", "")
             metadata[f"{self.filter_id}_awipsid"] = awipsid
 
-            if not result and isinstance(awipsid, str) and awipsid.upper() == "TSTMSG":
+            if not result and isinstance(awipsid, str) and is_test_message(awipsid):
                 metadata[f"{self.filter_id}_reason"] = "test_message_filtered"
             elif result:
                 metadata[f"{self.filter_id}_reason"] = "not_test_message"
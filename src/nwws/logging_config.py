@@ -13,6 +13,9 @@ class LoggingConfig:
     _configured = False
     _log_level = "INFO"
     _log_file: str | None = None
+    # Mirrors whether the installed handlers accept DEBUG records. loguru's default
+    # stderr handler does until configure() replaces it.
+    _debug_enabled = True
 
     @classmethod
     def configure(cls, log_level: str, log_file: str | None = None) -> None:
@@ -51,6 +54,7 @@ class LoggingConfig:
             )
             logger.info("File logging enabled", log_file=log_file)
 
+        cls._debug_enabled = logger.level(log_level).no <= logger.level("DEBUG").no
         cls._configured = True
         logger.info("Logging configuration applied", level=log_level)
 
@@ -217,6 +221,18 @@ class LoggingConfig:
         """Check if logging has been configured."""
         return cls._configured
 
+    @classmethod
+    def is_debug_enabled(cls) -> bool:
+        """Check if the handlers installed by configure() accept DEBUG level records.
+
+        Hot paths call this per event so debug calls can be skipped entirely,
+        avoiding keyword argument evaluation and record construction that loguru
+        performs before discarding a filtered record. The level is tracked here
+        rather than read from loguru, so handlers added outside this class are not
+        reflected.
+        """
+        return cls._debug_enabled
+
     @classmethod
     def reconfigure_for_thread(cls) -> None:
         """Reconfigure logging for a new thread context.
@@ -238,5 +254,6 @@ class LoggingConfig:
         cls._configured = False
         cls._log_level = "INFO"
         cls._log_file = None
+        cls._debug_enabled = False
         with suppress(ValueError):
             logger.remove()
@@ -6,9 +6,17 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from .types import Histogram, MetricType
+
 if TYPE_CHECKING:
     from .registry import MetricRegistry
-    from .types import Metric
+    from .types import Metric, MetricKey
+
+_PROMETHEUS_TYPES: dict[MetricType, str] = {
+    MetricType.COUNTER: "counter",
+    MetricType.GAUGE: "gauge",
+    MetricType.HISTOGRAM: "histogram",
+}
 
 
 class MetricExporter(ABC):
@@ -30,6 +38,12 @@ class MetricExporter(ABC):
 class PrometheusExporter(MetricExporter):
     """Exporter for Prometheus metrics format."""
 
+    def __init__(self, registry: MetricRegistry) -> None:
+        """Initialize the exporter with a metric registry."""
+        super().__init__(registry)
+        # Metric keys are immutable, so their formatted label sets can be reused
+        self._labels_cache: dict[MetricKey, str] = {}
+
     def export(self) -> str:
         """Export metrics in Prometheus exposition format."""
         lines: list[str] = []
@@ -59,26 +73,17 @@ class PrometheusExporter(MetricExporter):
         if hasattr(metric.value, "buckets"):  # Histogram
             lines.extend(self._format_histogram(metric))
         else:  # Counter or Gauge
-            labels_str = self._format_labels(metric.key.labels_dict())
+            labels_str = self._format_key_labels(metric.key)
             lines.append(f"{metric.key.name}{labels_str} {metric.value}")
 
         return lines
 
     def _get_prometheus_type(self, metric: Metric) -> str:
         """Get the Prometheus type string for a metric."""
-        from .types import MetricType
-
-        type_mapping = {
-            MetricType.COUNTER: "counter",
-            MetricType.GAUGE: "gauge",
-            MetricType.HISTOGRAM: "histogram",
-        }
-        return type_mapping.get(metric.metric_type, "untyped")
+        return _PROMETHEUS_TYPES.get(metric.metric_type, "untyped")
 
     def _format_histogram(self, metric: Metric) -> list[str]:
         """Format a histogram metric for Prometheus."""
-        from .types import Histogram
-
         lines: list[str] = []
         base_labels = metric.key.labels_dict()
 
@@ -94,12 +99,19 @@ class PrometheusExporter(MetricExporter):
             lines.append(f"{metric.key.name}_bucket{labels_str} {count}")
 
         # Sum and count
-        labels_str = self._format_labels(base_labels)
+        labels_str = self._format_key_labels(metric.key)
         lines.append(f"{metric.key.name}_sum{labels_str} {histogram.sum}")
         lines.append(f"{metric.key.name}_count{labels_str} {histogram.count}")
 
         return lines
 
+    def _format_key_labels(self, key: MetricKey) -> str:
+        """Format a metric key's labels for Prometheus, cached per key."""
+        labels_str = self._labels_cache.get(key)
+        if labels_str is None:
+            labels_str = self._labels_cache[key] = self._format_labels(key.labels_dict())
+        return labels_str
+
     def _format_labels(self, labels: dict[str, str]) -> str:
         """Format labels for Prometheus."""
         if not labels:
@@ -8,6 +8,13 @@ from typing import Any
 
 from .types import Histogram, Metric, MetricKey, MetricType
 
+# Registry summary section for each metric type
+_SUMMARY_SECTIONS: dict[MetricType, str] = {
+    MetricType.COUNTER: "counters",
+    MetricType.GAUGE: "gauges",
+    MetricType.HISTOGRAM: "histograms",
+}
+
 
 class MetricRegistry:
     """Thread-safe registry for storing and managing metrics."""
@@ -169,14 +176,9 @@ class MetricRegistry:
             }
 
             for metric in self._metrics.values():
-                metric_dict = metric.to_dict()
-
-                if metric.metric_type == MetricType.COUNTER:
-                    summary["counters"][metric.key.name] = metric_dict
-                elif metric.metric_type == MetricType.GAUGE:
-                    summary["gauges"][metric.key.name] = metric_dict
-                elif metric.metric_type == MetricType.HISTOGRAM:
-                    summary["histograms"][metric.key.name] = metric_dict
+                section = _SUMMARY_SECTIONS.get(metric.metric_type)
+                if section is not None:
+                    summary[section][metric.key.name] = metric.to_dict()
 
             return summary
 
@@ -1,10 +1,37 @@
 """Application configuration for NWWS-OI client."""
 
 import os
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
 
-@dataclass
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean flag from an environment variable value."""
+    return value.lower() in _TRUE_VALUES
+
+
+# (field name, environment variable, parser, default) for each setting
+_ENV_FIELDS: tuple[tuple[str, str, Callable[[str], Any], str | None], ...] = (
+    ("nwws_username", "NWWS_USERNAME", str, ""),
+    ("nwws_password", "NWWS_PASSWORD", str, ""),
+    ("nwws_server", "NWWS_SERVER", str, "nwws-oi.weather.gov"),
+    ("nwws_port", "NWWS_PORT", int, "5222"),
+    ("log_level", "LOG_LEVEL", str, "INFO"),
+    ("log_file", "LOG_FILE", str, None),
+    ("metric_server", "METRIC_SERVER", _parse_bool, "true"),
+    ("metric_port", "METRIC_PORT", int, "8080"),
+    ("metric_host", "METRIC_HOST", str, "127.0.0.1"),
+    ("outputs", "OUTPUTS", str, "console"),
+    ("ingest_queue_size", "INGEST_QUEUE_SIZE", int, "1024"),
+    ("ingest_workers", "INGEST_WORKERS", int, "4"),
+    ("shutdown_timeout_seconds", "SHUTDOWN_TIMEOUT_SECONDS", float, "30.0"),
+)
+
+
+@dataclass(slots=True)
 class Config:
     """Configuration class for NWWS-OI client."""
 
@@ -18,19 +45,16 @@ class Config:
     metric_port: int = 8080  # Port for  metrics endpoint
     metric_host: str = "127.0.0.1"  # Host for metrics endpoint
     outputs: str = "console"  # Comma-separated list of outputs (console,mqtt)
+    ingest_queue_size: int = 1024  # Events buffered ahead of the pipeline
+    ingest_workers: int = 4  # Concurrent pipeline ingest workers
+    shutdown_timeout_seconds: float = 30.0  # Per-service limit when stopping services
 
     @classmethod
     def from_env(cls) -> "Config":
         """Create config from environment variables."""
-        return cls(
-            nwws_username=os.getenv("NWWS_USERNAME", ""),
-            nwws_password=os.getenv("NWWS_PASSWORD", ""),
-            nwws_server=os.getenv("NWWS_SERVER", "nwws-oi.weather.gov"),
-            nwws_port=int(os.getenv("NWWS_PORT", "5222")),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            log_file=os.getenv("LOG_FILE"),
-            metric_server=os.getenv("METRIC_SERVER", "true").lower() in ("true", "1", "yes"),
-            metric_port=int(os.getenv("METRIC_PORT", "8080")),
-            metric_host=os.getenv("METRIC_HOST", "127.0.0.1"),
-            outputs=os.getenv("OUTPUTS", "console"),
-        )
+        environ = os.environ
+        values: dict[str, Any] = {}
+        for field_name, env_name, parse, default in _ENV_FIELDS:
+            raw = environ.get(env_name, default)
+            values[field_name] = None if raw is None else parse(raw)
+        return cls(**values)
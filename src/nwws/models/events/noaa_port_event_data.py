@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from nwws.pipeline import PipelineEvent
+from nwws.pipeline.types import PipelineEvent
 
 
 @dataclass
@@ -11,15 +11,55 @@ from .noaa_port_event_data import NoaaPortEventData
 class TextProductEventData(NoaaPortEventData):
     """Pipeline event wrapper for WeatherWire events."""
 
+    # The serialized product is cached in a slot rather than the instance __dict__:
+    # events are copied and rebuilt from __dict__ (with_stage, transformers), which
+    # must neither carry a stale serialization nor pass it back to __init__.
+    __slots__ = ("_product_json_cache",)
+
     product: TextProductModel
     """WeatherWire text product model converted from raw data."""
 
+    def _serialized_product(self) -> tuple[TextProductModel, bytes, str | None]:
+        """Return the cached serialization, refreshing it if the product was replaced."""
+        product = self.product
+        cache: tuple[TextProductModel, bytes, str | None] | None = getattr(
+            self, "_product_json_cache", None
+        )
+        if cache is None or cache[0] is not product:
+            json_bytes = product.__pydantic_serializer__.to_json(
+                product,
+                indent=2,
+                exclude_defaults=True,
+                exclude_unset=True,
+                exclude_none=True,
+                by_alias=True,
+            )
+            cache = (product, json_bytes, None)
+            self._product_json_cache = cache
+        return cache
+
+    @property
+    def product_json_bytes(self) -> bytes:
+        """UTF-8 encoded JSON serialization of the text product.
+
+        Serialized once per event straight to bytes by the model's compiled
+        serializer, so outputs that publish bytes avoid a separate encode step.
+        """
+        return self._serialized_product()[1]
+
+    @property
+    def product_json(self) -> str:
+        """JSON serialization of the text product.
+
+        Serialized once per event and shared by every output that the event is
+        fanned out to, as well as by the pipeline's payload size accounting.
+        """
+        product, json_bytes, json_str = self._serialized_product()
+        if json_str is None:
+            json_str = json_bytes.decode()
+            self._product_json_cache = (product, json_bytes, json_str)
+        return json_str
+
     def __str__(self) -> str:
         """Return a string representation of the text product event."""
-        return self.product.model_dump_json(
-            indent=2,
-            exclude_defaults=True,
-            exclude_unset=True,
-            exclude_none=True,
-            by_alias=True,
-        )
+        return self.product_json
@@ -1,9 +1,30 @@
 """Output modules for the NWWS2MQTT pipeline."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .console import ConsoleOutput
-from .database import DatabaseConfig, DatabaseOutput
 from .mqtt import MQTTConfig, MQTTOutput
 
+if TYPE_CHECKING:
+    from .database import DatabaseConfig, DatabaseOutput
+
+# The database output pulls in SQLAlchemy, so it is only imported on first use
+_LAZY_EXPORTS = {"DatabaseConfig": ".database", "DatabaseOutput": ".database"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported outputs on first attribute access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "ConsoleOutput",
     "DatabaseConfig",
@@ -3,17 +3,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import os
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import paho.mqtt.client as mqtt
 from loguru import logger
+from paho.mqtt.enums import CallbackAPIVersion
 
 from nwws.models.events import TextProductEventData
 from nwws.models.events.xml_event_data import XmlEventData
 from nwws.pipeline import Output, PipelineEvent
-from nwws.utils import build_topic
+from nwws.utils import LoggingConfig, build_topic
+
+if TYPE_CHECKING:
+    from paho.mqtt.properties import Properties
+    from paho.mqtt.reasoncodes import ReasonCode
+
+# Upper bound on how long send() waits for outstanding publish acks to drain
+_ACK_WAIT_TIMEOUT_SECONDS = 30.0
+
+# Minimum interval between "not connected" warnings while publishes are dropped
+_DROP_WARNING_INTERVAL_SECONDS = 1.0
 
 
 @dataclass
@@ -39,6 +54,20 @@ class MQTTConfig:
     mqtt_topic_prefix: str = "nwws"
     mqtt_qos: int = 1
     mqtt_client_id: str = "nwws-oi-client"
+    mqtt_ack_batch_size: int = 64
+
+    def __post_init__(self) -> None:
+        """Validate settings that would otherwise stall publishing.
+
+        Raises:
+            ValueError: If the ack batch size is not positive.
+
+        """
+        if self.mqtt_ack_batch_size < 1:
+            batch_error = (
+                f"Invalid MQTT ack batch size: {self.mqtt_ack_batch_size}. Must be positive"
+            )
+            raise ValueError(batch_error)
 
     @classmethod
     def from_env(cls) -> MQTTConfig:
@@ -58,6 +87,8 @@ class MQTTConfig:
         - MQTT_TOPIC_PREFIX: Base topic prefix for all publications (default: "nwws")
         - MQTT_QOS: Quality of Service level 0-2 (default: 1)
         - MQTT_CLIENT_ID: Unique client identifier (default: "nwws-oi-client")
+        - MQTT_ACK_BATCH_SIZE: Unacknowledged publishes allowed before send()
+          waits for acks to drain (default: 64)
 
         Returns:
             MQTTConfig: Fully configured instance with environment-based settings.
@@ -74,6 +105,7 @@ class MQTTConfig:
             mqtt_topic_prefix=os.getenv("MQTT_TOPIC_PREFIX", "nwws"),
             mqtt_qos=int(os.getenv("MQTT_QOS", "1")),
             mqtt_client_id=os.getenv("MQTT_CLIENT_ID", "nwws-oi-client"),
+            mqtt_ack_batch_size=int(os.getenv("MQTT_ACK_BATCH_SIZE", "64")),
         )
 
 
@@ -96,6 +128,11 @@ class MQTTOutput(Output):
     to prevent data loss. The implementation uses the Paho MQTT client library
     with callback-based event handling for optimal performance in high-throughput
     scenarios.
+
+    Publish acknowledgements are confirmed asynchronously in batches: message ids
+    are tracked as they are published and released by the on_publish callback,
+    and send() only waits once a full batch is outstanding. This provides
+    backpressure when the broker stalls without paying a per-message round trip.
     """
 
     def __init__(self, output_id: str = "mqtt", *, config: MQTTConfig | None) -> None:
@@ -122,8 +159,28 @@ class MQTTOutput(Output):
         super().__init__(output_id)
         self.config = config or MQTTConfig.from_env()
 
+        # Publish settings are invariant for the output's lifetime, so the per-event
+        # path reads them from locals rather than through the config object
+        self._topic_prefix = self.config.mqtt_topic_prefix
+        self._qos = self.config.mqtt_qos
+        self._ack_batch_size = self.config.mqtt_ack_batch_size
+        self._ack_low_water = self._ack_batch_size // 2
+
         self._client: mqtt.Client | None = None
         self._connected = False
+        self._dropped_count = 0
+        self._last_drop_warning = 0.0
+
+        # Publish ack tracking, updated from both the event loop and paho's thread
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ack_lock = threading.Lock()
+        self._pending_mids: set[int] = set()
+        self._early_acks: set[int] = set()
+        self._acks_drained = asyncio.Event()
+        # Number of send() calls parked in _wait_for_acks; several ingest workers
+        # may apply backpressure at once
+        self._ack_waiters = 0
+        self._wake_scheduled = False
 
         logger.info("MQTT Output initialized", output_id=self.output_id)
 
@@ -157,14 +214,19 @@ class MQTTOutput(Output):
 
         self._client = None
         self._connected = False
+        self._loop = asyncio.get_running_loop()
 
         try:
             # Create MQTT client
-            self._client = mqtt.Client(client_id=self.config.mqtt_client_id)
+            self._client = mqtt.Client(
+                callback_api_version=CallbackAPIVersion.VERSION2,
+                client_id=self.config.mqtt_client_id,
+            )
 
             # Set callbacks
             self._client.on_connect = self._on_connect
             self._client.on_disconnect = self._on_disconnect
+            self._client.on_publish = self._on_publish
 
             # Set credentials if provided
             if self.config.mqtt_username and self.config.mqtt_password:
@@ -223,6 +285,9 @@ class MQTTOutput(Output):
                 self._client.disconnect()
                 self._client.loop_stop()
                 self._connected = False
+                with self._ack_lock:
+                    self._pending_mids.clear()
+                    self._early_acks.clear()
                 logger.info("MQTT output stopped", output_id=self.output_id)
             except OSError as e:
                 logger.error(
@@ -270,55 +335,71 @@ class MQTTOutput(Output):
 
         """
         if not (isinstance(event, (XmlEventData, TextProductEventData))):
-            logger.debug(
-                "Skipping unknown event",
-                output_id=self.output_id,
-                event_type=type(event).__name__,
-            )
+            if LoggingConfig.is_debug_enabled():
+                logger.debug(
+                    "Skipping unknown event",
+                    output_id=self.output_id,
+                    event_type=type(event).__name__,
+                )
             return
 
-        if not self._client or not self._connected:
-            logger.warning(
-                "MQTT client not connected, skipping publish",
-                output_id=self.output_id,
-                event_id=event.metadata.event_id,
-            )
+        client = self._client
+        if not self._connected or client is None:
+            self._dropped_count += 1
+            # Rate limit the warning so reconnect storms don't flood the log
+            now = time.monotonic()
+            if now - self._last_drop_warning >= _DROP_WARNING_INTERVAL_SECONDS:
+                self._last_drop_warning = now
+                logger.warning(
+                    "MQTT client not connected, skipping publish",
+                    output_id=self.output_id,
+                    event_id=event.metadata.event_id,
+                    dropped_count=self._dropped_count,
+                )
             return
 
         try:
             # Create topic using configured pattern and dynamic component resolution
-            topics = [build_topic(event=event, prefix=self.config.mqtt_topic_prefix)]
-
-            # The event's __str__ method should return a valid string representation
-            payload = str(event)
+            topic = build_topic(event=event, prefix=self._topic_prefix)
+
+            # Text products are published as pre-encoded JSON bytes, other events
+            # use their string representation
+            payload = (
+                event.product_json_bytes
+                if isinstance(event, TextProductEventData)
+                else str(event)
+            )
 
             # Publish message
-            for topic in topics:
-                result = self._client.publish(
-                    topic,
-                    payload,
-                    qos=self.config.mqtt_qos,
+            result = client.publish(
+                topic,
+                payload,
+                qos=self._qos,
+            )
+
+            if result.rc == mqtt.MQTT_ERR_SUCCESS:
+                self._track_publish(result.mid)
+                logger.info(
+                    "Published to MQTT",
+                    output_id=self.output_id,
+                    event_id=event.metadata.event_id,
+                    product_id=event.id,
+                    topic=topic,
+                    content_type=event.content_type,
+                )
+            else:
+                logger.warning(
+                    "Failed to publish to MQTT",
+                    output_id=self.output_id,
+                    event_id=event.metadata.event_id,
+                    return_code=result.rc,
+                    topic=topic,
+                    product_id=event.id,
+                    content_type=event.content_type,
                 )
 
-                if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                    logger.info(
-                        "Published to MQTT",
-                        output_id=self.output_id,
-                        event_id=event.metadata.event_id,
-                        product_id=event.id,
-                        topic=topic,
-                        content_type=event.content_type,
-                    )
-                else:
-                    logger.warning(
-                        "Failed to publish to MQTT",
-                        output_id=self.output_id,
-                        event_id=event.metadata.event_id,
-                        return_code=result.rc,
-                        topic=topic,
-                        product_id=event.id,
-                        content_type=event.content_type,
-                    )
+            if len(self._pending_mids) >= self._ack_batch_size:
+                await self._wait_for_acks()
 
         except (ConnectionError, OSError, ValueError) as e:
             logger.error(
@@ -343,29 +424,111 @@ class MQTTOutput(Output):
         """
         return self._connected
 
+    def _track_publish(self, mid: int) -> None:
+        """Record a published message id until its ack arrives."""
+        with self._ack_lock:
+            # Paho may fire on_publish before publish() returns the message info
+            if mid in self._early_acks:
+                self._early_acks.discard(mid)
+            else:
+                self._pending_mids.add(mid)
+
+    async def _wait_for_acks(self) -> None:
+        """Wait until outstanding publish acks drop below the low-water mark.
+
+        Paho's thread only hands off to the event loop while a waiter is parked
+        here, and at most once per wait, so acks that arrive without
+        backpressure never pay for a cross-thread wakeup. Concurrent waiters
+        share the drained event and are counted, so one leaving does not stop
+        wakeups for the others.
+        """
+        batch_size = self._ack_batch_size
+        registered = False
+        try:
+            async with asyncio.timeout(_ACK_WAIT_TIMEOUT_SECONDS):
+                while True:
+                    with self._ack_lock:
+                        if len(self._pending_mids) < batch_size:
+                            break
+                        self._acks_drained.clear()
+                        self._wake_scheduled = False
+                        if not registered:
+                            self._ack_waiters += 1
+                            registered = True
+                    await self._acks_drained.wait()
+        except TimeoutError:
+            logger.warning(
+                "Timed out waiting for MQTT publish acknowledgements",
+                output_id=self.output_id,
+                pending_count=len(self._pending_mids),
+            )
+        finally:
+            if registered:
+                with self._ack_lock:
+                    self._ack_waiters -= 1
+
+    def _on_publish(
+        self,
+        _client: mqtt.Client,
+        _userdata: object,
+        mid: int,
+        _reason_code: ReasonCode,
+        _properties: Properties | None,
+    ) -> None:
+        """Handle MQTT publish acknowledgement from paho's network thread."""
+        with self._ack_lock:
+            if mid in self._pending_mids:
+                self._pending_mids.discard(mid)
+            else:
+                self._early_acks.add(mid)
+            wake = (
+                self._ack_waiters > 0
+                and not self._wake_scheduled
+                and len(self._pending_mids) <= self._ack_low_water
+            )
+            if wake:
+                self._wake_scheduled = True
+
+        if wake and self._loop is not None:
+            # The loop may already be closed while paho flushes during shutdown
+            with contextlib.suppress(RuntimeError):
+                self._loop.call_soon_threadsafe(self._acks_drained.set)
+
     def _on_connect(
         self,
         _client: mqtt.Client,
         _userdata: object,
-        _flags: dict[str, int],
-        rc: int,
+        _flags: mqtt.ConnectFlags,
+        reason_code: ReasonCode,
+        _properties: Properties | None,
     ) -> None:
         """Handle MQTT connection."""
-        if rc == 0:
+        if not reason_code.is_failure:
+            # Message ids restart with the new session, so acks recorded ahead of
+            # their publish on the old one must not release a reused id
+            with self._ack_lock:
+                self._early_acks.clear()
             self._connected = True
             logger.info("Connected to MQTT broker", output_id=self.output_id)
         else:
-            error_msg = f"Failed to connect to MQTT broker: {rc}"
+            error_msg = f"Failed to connect to MQTT broker: {reason_code}"
             logger.error(error_msg, output_id=self.output_id)
 
-    def _on_disconnect(self, _client: mqtt.Client, _userdata: object, rc: int) -> None:
+    def _on_disconnect(
+        self,
+        _client: mqtt.Client,
+        _userdata: object,
+        _flags: mqtt.DisconnectFlags,
+        reason_code: ReasonCode,
+        _properties: Properties | None,
+    ) -> None:
         """Handle MQTT disconnection."""
         self._connected = False
-        if rc != 0:
+        if reason_code.is_failure:
             logger.warning(
                 "Unexpected MQTT disconnection",
                 output_id=self.output_id,
-                return_code=rc,
+                return_code=reason_code.value,
             )
         else:
             logger.info("Disconnected from MQTT broker", output_id=self.output_id)
@@ -413,7 +576,7 @@ class MQTTOutput(Output):
 
         if isinstance(event, (XmlEventData, TextProductEventData)):
             # Build the topic that would be used
-            topic = build_topic(event=event, prefix=self.config.mqtt_topic_prefix)
+            topic = build_topic(event=event, prefix=self._topic_prefix)
             metadata[f"{self.output_id}_target_topic"] = topic
             metadata[f"{self.output_id}_event_processed"] = True
             metadata[f"{self.output_id}_payload_size"] = len(str(event))
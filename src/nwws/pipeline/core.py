@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING, Any, Self
 
 from loguru import logger
 
+from nwws.logging_config import LoggingConfig
+
 from .errors import PipelineError, PipelineErrorHandler
 from .types import PipelineEvent, PipelineStage
 
@@ -405,17 +407,18 @@ class Pipeline:
                             event_type=event_type,
                         )
 
-                    logger.debug(
-                        "Event filtered out",
-                        pipeline_id=self.pipeline_id,
-                        filter_id=filter_instance.filter_id,
-                        event_id=event.metadata.event_id,
-                        trace_id=current_event.metadata.trace_id,
-                        event_age_seconds=current_event.metadata.age_seconds,
-                        stage=current_event.metadata.stage.value,
-                        source=current_event.metadata.source,
-                        event_type=type(current_event).__name__,
-                    )
+                    if LoggingConfig.is_debug_enabled():
+                        logger.debug(
+                            "Event filtered out",
+                            pipeline_id=self.pipeline_id,
+                            filter_id=filter_instance.filter_id,
+                            event_id=event.metadata.event_id,
+                            trace_id=current_event.metadata.trace_id,
+                            event_age_seconds=current_event.metadata.age_seconds,
+                            stage=current_event.metadata.stage.value,
+                            source=current_event.metadata.source,
+                            event_type=type(current_event).__name__,
+                        )
                     return None
 
                 # Record successful filter application
@@ -520,18 +523,19 @@ class Pipeline:
             # Record successful transformation with enhanced logging
             duration_ms = (time.time() - start_time) * 1000
 
-            logger.debug(
-                "Event transformation completed",
-                pipeline_id=self.pipeline_id,
-                transformer_id=self.transformer.transformer_id,
-                event_id=current_event.metadata.event_id,
-                trace_id=current_event.metadata.trace_id,
-                input_type=type(current_event).__name__,
-                output_type=type(transformed_event).__name__,
-                event_age_seconds=current_event.metadata.age_seconds,
-                transformation_duration_ms=duration_ms,
-                stage=current_event.metadata.stage.value,
-            )
+            if LoggingConfig.is_debug_enabled():
+                logger.debug(
+                    "Event transformation completed",
+                    pipeline_id=self.pipeline_id,
+                    transformer_id=self.transformer.transformer_id,
+                    event_id=current_event.metadata.event_id,
+                    trace_id=current_event.metadata.trace_id,
+                    input_type=type(current_event).__name__,
+                    output_type=type(transformed_event).__name__,
+                    event_age_seconds=current_event.metadata.age_seconds,
+                    transformation_duration_ms=duration_ms,
+                    stage=current_event.metadata.stage.value,
+                )
 
             if self.stats_collector:
                 processing_duration_seconds = time.time() - start_time
@@ -599,6 +603,10 @@ class Pipeline:
         automatic cancellation and cleanup if any output fails. TaskGroup provides
         better error handling and resource management compared to asyncio.gather.
 
+        When only a single output is configured the event is delivered directly,
+        skipping the per-event TaskGroup and task allocation since there is
+        nothing to run concurrently.
+
         The event's processing stage is updated to OUTPUT before delivery to
         support proper error handling and tracing throughout the output stage.
 
@@ -617,6 +625,10 @@ class Pipeline:
         if not self.outputs:
             return
 
+        if len(self.outputs) == 1:
+            await self._send_to_single_output(self.outputs[0], output_event)
+            return
+
         # Send to all outputs concurrently using TaskGroup for structured concurrency
         try:
             async with asyncio.TaskGroup() as tg:
@@ -668,18 +680,19 @@ class Pipeline:
             # Record successful output with enhanced logging
             duration_ms = (time.time() - start_time) * 1000
 
-            logger.debug(
-                "Event output completed",
-                pipeline_id=self.pipeline_id,
-                output_id=output.output_id,
-                event_id=event.metadata.event_id,
-                trace_id=event.metadata.trace_id,
-                event_type=type(event).__name__,
-                event_age_seconds=event.metadata.age_seconds,
-                output_duration_ms=duration_ms,
-                stage=event.metadata.stage.value,
-                source=event.metadata.source,
-            )
+            if LoggingConfig.is_debug_enabled():
+                logger.debug(
+                    "Event output completed",
+                    pipeline_id=self.pipeline_id,
+                    output_id=output.output_id,
+                    event_id=event.metadata.event_id,
+                    trace_id=event.metadata.trace_id,
+                    event_type=type(event).__name__,
+                    event_age_seconds=event.metadata.age_seconds,
+                    output_duration_ms=duration_ms,
+                    stage=event.metadata.stage.value,
+                    source=event.metadata.source,
+                )
 
             if self.stats_collector:
                 processing_duration_seconds = time.time() - start_time
@@ -715,7 +728,6 @@ class Pipeline:
             logger.error(
                 "Output processing error",
                 pipeline_id=self.pipeline_id,
-                output_id=output.output_id,
                 event_id=event.metadata.event_id,
                 error=str(e),
                 error_type=type(e).__name__,
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -181,6 +182,9 @@ class PipelineErrorHandler:
         self._last_errors: dict[str, PipelineErrorEvent] = {}
         self._retry_counts: dict[str, int] = {}
         self._circuit_breaker_states: dict[str, dict[str, Any]] = {}
+        # Stage components whose last outcome was a failure; all others take the
+        # fast path in execute_with_retry
+        self._failing_keys: set[str] = set()
 
     def handle_error(  # noqa: PLR0913
         self,
@@ -236,6 +240,7 @@ class PipelineErrorHandler:
         # Update circuit breaker state if using that strategy
         if self.strategy == ErrorHandlingStrategy.CIRCUIT_BREAKER:
             self._update_circuit_breaker(error_key, failed=True)
+            self._failing_keys.add(error_key)
 
         return error_event
 
@@ -273,10 +278,26 @@ class PipelineErrorHandler:
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        """Execute an operation with retry logic."""
+        """Execute an operation with retry logic.
+
+        While the stage component has no failure on record, the first attempt runs
+        without the circuit breaker check or success bookkeeping, which would leave
+        the state unchanged. A failure marks the component as failing so later calls
+        take the full path until an operation succeeds again.
+        """
         error_key = f"{stage.value}.{stage_id}"
+        first_attempt = 0
+
+        if error_key not in self._failing_keys:
+            try:
+                return await self._call_operation(operation, *args, **kwargs)
+            except Exception as e:
+                self._failing_keys.add(error_key)
+                if not await self._retry_after_failure(stage, stage_id, error_key, 0, e):
+                    raise
+            first_attempt = 1
 
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(first_attempt, self.max_retries + 1):
             try:
                 if self._is_circuit_breaker_open(error_key):
                     error_msg = f"Circuit breaker is open for {error_key}"
@@ -286,10 +307,7 @@ class PipelineErrorHandler:
                         stage_id,
                     )
 
-                if asyncio.iscoroutinefunction(operation):
-                    result = await operation(*args, **kwargs)  # type: ignore[misc]
-                else:
-                    result = operation(*args, **kwargs)
+                result = await self._call_operation(operation, *args, **kwargs)
 
                 # Reset retry count on success
                 self._retry_counts[error_key] = 0
@@ -298,35 +316,58 @@ class PipelineErrorHandler:
                 if self.strategy == ErrorHandlingStrategy.CIRCUIT_BREAKER:
                     self._update_circuit_breaker(error_key, failed=False)
 
+                self._failing_keys.discard(error_key)
                 return result  # noqa: TRY300
 
             except Exception as e:
-                self._retry_counts[error_key] = attempt + 1
-
-                if attempt < self.max_retries and await self.should_retry(
-                    stage, stage_id, e
-                ):
-                    delay = self.retry_delay_seconds * (
-                        self.backoff_multiplier**attempt
-                    )
-                    logger.info(
-                        "Retrying operation",
-                        stage=stage.value,
-                        stage_id=stage_id,
-                        attempt=attempt + 1,
-                        max_retries=self.max_retries,
-                        delay=delay,
-                        error=str(e),
-                    )
-                    await asyncio.sleep(delay)
+                if await self._retry_after_failure(stage, stage_id, error_key, attempt, e):
                     continue
-
-                # Final failure
-                if self.strategy == ErrorHandlingStrategy.CIRCUIT_BREAKER:
-                    self._update_circuit_breaker(error_key, failed=True)
                 raise
         return None
 
+    @staticmethod
+    async def _call_operation(operation: Any, *args: Any, **kwargs: Any) -> Any:
+        """Call an operation, awaiting the result when it is awaitable."""
+        result = operation(*args, **kwargs)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
+    async def _retry_after_failure(
+        self,
+        stage: PipelineStage,
+        stage_id: StageId,
+        error_key: str,
+        attempt: int,
+        exception: Exception,
+    ) -> bool:
+        """Record a failed attempt and wait out the backoff if it should be retried.
+
+        Returns:
+            True if the operation should be attempted again, False if the failure is final.
+
+        """
+        self._retry_counts[error_key] = attempt + 1
+
+        if attempt < self.max_retries and await self.should_retry(stage, stage_id, exception):
+            delay = self.retry_delay_seconds * (self.backoff_multiplier**attempt)
+            logger.info(
+                "Retrying operation",
+                stage=stage.value,
+                stage_id=stage_id,
+                attempt=attempt + 1,
+                max_retries=self.max_retries,
+                delay=delay,
+                error=str(exception),
+            )
+            await asyncio.sleep(delay)
+            return True
+
+        # Final failure
+        if self.strategy == ErrorHandlingStrategy.CIRCUIT_BREAKER:
+            self._update_circuit_breaker(error_key, failed=True)
+        return False
+
     def _is_circuit_breaker_open(self, error_key: str) -> bool:
         """Check if circuit breaker is open for the given error key."""
         if error_key not in self._circuit_breaker_states:
@@ -537,3 +578,4 @@ class PipelineErrorHandler:
         self._last_errors.clear()
         self._retry_counts.clear()
         self._circuit_breaker_states.clear()
+        self._failing_keys.clear()
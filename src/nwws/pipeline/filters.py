@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
+from nwws.logging_config import LoggingConfig
+
 from .errors import FilterError
 
 if TYPE_CHECKING:
@@ -73,20 +75,22 @@ class Filter(ABC):
             # Process the event
             result = self.should_process(event)
 
-            # Get decision metadata
-            decision_metadata = self.get_filter_decision_metadata(event, result=result)
-            duration_ms = (time.time() - start_time) * 1000
-            decision_metadata[f"{self.filter_id}_duration_ms"] = duration_ms
-
-            # Log the decision with metadata
-            logger.debug(
-                "Filter applied",
-                filter_id=self.filter_id,
-                event_id=event.metadata.event_id,
-                result=result,
-                duration_ms=duration_ms,
-                **decision_metadata,
-            )
+            # Decision metadata is only built for the debug log, so skip it when disabled
+            if LoggingConfig.is_debug_enabled():
+                # Get decision metadata
+                decision_metadata = self.get_filter_decision_metadata(event, result=result)
+                duration_ms = (time.time() - start_time) * 1000
+                decision_metadata[f"{self.filter_id}_duration_ms"] = duration_ms
+
+                # Log the decision with metadata
+                logger.debug(
+                    "Filter applied",
+                    filter_id=self.filter_id,
+                    event_id=event.metadata.event_id,
+                    result=result,
+                    duration_ms=duration_ms,
+                    **decision_metadata,
+                )
 
         except Exception as e:
             logger.error(
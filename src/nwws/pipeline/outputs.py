@@ -47,6 +47,14 @@ class Output(ABC):
         self.output_id = output_id
         self._is_started = False
 
+        # Per-event metadata keys and values, built once rather than per event
+        self._destination = self.__class__.__name__.lower().replace("output", "")
+        self._destination_key = f"{output_id}_destination"
+        self._event_age_key = f"{output_id}_event_age_seconds"
+        self._timestamp_key = f"{output_id}_timestamp"
+        self._duration_key = f"{output_id}_duration_ms"
+        self._success_key = f"{output_id}_success"
+
     @abstractmethod
     async def send(self, event: PipelineEvent) -> None:
         """Send the event to the output destination.
@@ -87,9 +95,9 @@ class Output(ABC):
 
         """
         return {
-            f"{self.output_id}_destination": self.__class__.__name__.lower().replace("output", ""),
-            f"{self.output_id}_event_age_seconds": event.metadata.age_seconds,
-            f"{self.output_id}_timestamp": time.time(),
+            self._destination_key: self._destination,
+            self._event_age_key: event.metadata.age_seconds,
+            self._timestamp_key: time.time(),
         }
 
     async def __call__(self, event: PipelineEvent) -> None:
@@ -113,8 +121,8 @@ class Output(ABC):
 
             # Add timing information
             duration_ms = (time.time() - start_time) * 1000
-            output_metadata[f"{self.output_id}_duration_ms"] = duration_ms
-            output_metadata[f"{self.output_id}_success"] = True
+            output_metadata[self._duration_key] = duration_ms
+            output_metadata[self._success_key] = True
 
             logger.debug(
                 "Output sent successfully",
@@ -146,7 +154,7 @@ class Output(ABC):
         try:
             yield output_metadata
         finally:
-            output_metadata[f"{self.output_id}_duration_ms"] = (time.time() - start_time) * 1000
+            output_metadata[self._duration_key] = (time.time() - start_time) * 1000
 
 
 class LogOutput(Output):
@@ -17,6 +17,10 @@ if TYPE_CHECKING:
     from nwws.metrics import MetricRegistry
 
 
+# Characters not allowed in Prometheus label values
+_INVALID_LABEL_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+
+
 @dataclass
 class PipelineStatsEvent:
     """Statistics event for pipeline operations."""
@@ -61,10 +65,14 @@ class PipelineStatsCollector:
         self.metric_prefix = metric_prefix
         self.registry = registry
         self.collector = MetricsCollector(registry)
+        self._metric_names: dict[str, str] = {}
 
     def _make_metric_name(self, name: str) -> str:
-        """Create a full metric name with prefix."""
-        return f"{self.metric_prefix}_{name}"
+        """Create a full metric name with prefix, cached per name."""
+        metric_name = self._metric_names.get(name)
+        if metric_name is None:
+            metric_name = self._metric_names[name] = f"{self.metric_prefix}_{name}"
+        return metric_name
 
     def _make_labels(
         self, additional_labels: dict[str, str] | None = None
@@ -83,7 +91,7 @@ class PipelineStatsCollector:
     def _sanitize_label_value(self, value: str, max_length: int = 64) -> str:
         """Sanitize label values for Prometheus compatibility."""
         # Remove/replace problematic characters, truncate if needed
-        sanitized = re.sub(r"[^a-zA-Z0-9_-]", "_", value)
+        sanitized = _INVALID_LABEL_CHARS.sub("_", value)
         return sanitized[:max_length] if len(sanitized) > max_length else sanitized
 
     def _safe_metric_operation(
@@ -33,9 +33,14 @@ class PipelineStage(Enum):
     OUTPUT = "output"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineEventMetadata:
-    """Metadata for pipeline events."""
+    """Metadata for pipeline events.
+
+    Slotted because a fresh instance is created for every event at every stage
+    transition. Event classes themselves keep a ``__dict__``: stage copies clone
+    it and cached serializations are stored in it.
+    """
 
     event_id: EventId = field(default_factory=lambda: str(uuid.uuid4()))
     """Unique identifier for this event."""
@@ -8,13 +8,16 @@ import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-if TYPE_CHECKING:
-    from collections.abc import Callable
-
 from loguru import logger
 
 from nwws.metrics import MetricRegistry, MetricsCollector
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Characters not allowed in Prometheus label values
+_INVALID_LABEL_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 @dataclass(frozen=True)
 class ReceiverStatsEvent:
@@ -63,10 +66,14 @@ class WeatherWireStatsCollector:
         self.metric_prefix = metric_prefix
         self.registry = registry
         self.collector = MetricsCollector(registry)
+        self._metric_names: dict[str, str] = {}
 
     def _make_metric_name(self, name: str) -> str:
-        """Create a full metric name with prefix."""
-        return f"{self.metric_prefix}_{name}"
+        """Create a full metric name with prefix, cached per name."""
+        metric_name = self._metric_names.get(name)
+        if metric_name is None:
+            metric_name = self._metric_names[name] = f"{self.metric_prefix}_{name}"
+        return metric_name
 
     def _make_labels(self, additional_labels: dict[str, str] | None = None) -> dict[str, str]:
         """Create labels dict with receiver_id and any additional labels."""
@@ -83,7 +90,7 @@ class WeatherWireStatsCollector:
     def _sanitize_label_value(self, value: str, max_length: int = 64) -> str:
         """Sanitize label values for Prometheus compatibility."""
         # Remove/replace problematic characters, truncate if needed
-        sanitized = re.sub(r"[^a-zA-Z0-9_-]", "_", value)
+        sanitized = _INVALID_LABEL_CHARS.sub("_", value)
         return sanitized[:max_length] if len(sanitized) > max_length else sanitized
 
     def _safe_metric_operation(
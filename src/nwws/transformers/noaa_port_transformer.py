@@ -13,7 +13,7 @@ from nwws.pipeline import (
     PipelineEvent,
     Transformer,
 )
-from nwws.utils import convert_text_product_to_model
+from nwws.utils import LoggingConfig, convert_text_product_to_model
 from nwws.utils.ugc_loader import create_ugc_provider
 
 
@@ -34,10 +34,11 @@ class NoaaPortTransformer(Transformer):
     def transform(self, event: PipelineEvent) -> PipelineEvent:
         """Handle incoming NOAA Port event and convert to a product."""
         if not isinstance(event, NoaaPortEventData):
-            logger.debug(
-                "Event is not NoaaPortEventData, passing through",
-                event_type=type(event).__name__,
-            )
+            if LoggingConfig.is_debug_enabled():
+                logger.debug(
+                    "Event is not NoaaPortEventData, passing through",
+                    event_type=type(event).__name__,
+                )
             return event
 
         try:
@@ -54,12 +55,13 @@ class NoaaPortTransformer(Transformer):
             )
             return event
 
-        logger.debug(
-            "Transformed Raw Content to Text Product Model",
-            event_id=event.metadata.event_id,
-            product_id=event.id,
-            subject=event.subject,
-        )
+        if LoggingConfig.is_debug_enabled():
+            logger.debug(
+                "Transformed Raw Content to Text Product Model",
+                event_id=event.metadata.event_id,
+                product_id=event.id,
+                subject=event.subject,
+            )
 
         # Create new event using simplified helper method
         return self.create_transformed_event(
@@ -1,11 +1,12 @@
 """Utility functions and classes for the application."""
 
+from nwws.logging_config import LoggingConfig
+
 from .converters import (
     convert_text_product_to_model,
 )
 from .geo_provider import WeatherGeoDataProvider
 from .geohash import get_geohash_topics
-from .logging_config import LoggingConfig
 from .topic_builder import build_topic
 from .ugc_loader import create_ugc_provider
 
@@ -12,7 +12,7 @@ and the application's type-safe Pydantic models, ensuring data consistency and
 validation across the weather data processing pipeline.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from nwws.models.weather import (
     HVTECModel,
@@ -29,6 +29,46 @@ if TYPE_CHECKING:
     from pyiem.nws.vtec import VTEC
 
 
+class _ProductMethods(NamedTuple):
+    """Availability of the optional TextProduct accessor methods for a class."""
+
+    get_product_id: bool
+    get_nicedate: bool
+    get_main_headline: bool
+    get_signature: bool
+    get_channels: bool
+    is_correction: bool
+    is_resent: bool
+    parse_attn_wfo: bool
+    parse_attn_rfc: bool
+
+
+_PRODUCT_METHODS_CACHE: dict[type, _ProductMethods] = {}
+
+
+def _product_methods(product_obj: object) -> _ProductMethods:
+    """Return which accessor methods are available on the product's class.
+
+    Method availability is invariant for a given class, so the attribute probes
+    run once per product type and later conversions reuse the cached result.
+
+    Args:
+        product_obj: The product object whose methods should be probed.
+
+    Returns:
+        The cached method availability flags for the object's type.
+
+    """
+    product_type = type(product_obj)
+    methods = _PRODUCT_METHODS_CACHE.get(product_type)
+    if methods is None:
+        methods = _ProductMethods._make(
+            hasattr(product_obj, name) for name in _ProductMethods._fields
+        )
+        _PRODUCT_METHODS_CACHE[product_type] = methods
+    return methods
+
+
 def _safe_call_method(obj, method_name: str, default):
     """Safely call a method on an object with comprehensive error handling.
 
@@ -97,7 +137,7 @@ def convert_ugc_to_model(ugc_obj: "UGC") -> UGCModel:
         geoClass=getattr(ugc_obj, "geoclass", ""),
         number=getattr(ugc_obj, "number", 0),
         name=getattr(ugc_obj, "name", ""),
-        wfoIdList=list(getattr(ugc_obj, "wfos", [])),
+        wfoIdList=getattr(ugc_obj, "wfos", []),
     )
 
 
@@ -164,9 +204,9 @@ def convert_hvtec_to_model(hvtec_obj: "HVTEC") -> HVTECModel:
     nwsli_id_val = ""
     nwsli_attr = getattr(hvtec_obj, "nwsli", None)
     if nwsli_attr is not None:
-        nwsli_id_val = (
-            getattr(nwsli_attr, "id", "") if hasattr(nwsli_attr, "id") else str(nwsli_attr)
-        )
+        nwsli_id_val = getattr(nwsli_attr, "id", None)
+        if nwsli_id_val is None:
+            nwsli_id_val = str(nwsli_attr)
 
     return HVTECModel(
         line=getattr(hvtec_obj, "line", ""),
@@ -234,7 +274,7 @@ def convert_text_product_segment_to_model(
         vtecRecords=[convert_vtec_to_model(v) for v in getattr(segment_obj, "vtec", []) if v],
         ugcRecords=[convert_ugc_to_model(u) for u in getattr(segment_obj, "ugcs", []) if u],
         ugcExpireTime=getattr(segment_obj, "ugcexpire", None),
-        headlines=list(getattr(segment_obj, "headlines", [])),
+        headlines=getattr(segment_obj, "headlines", []),
         hvtecRecords=hvtec_list,
         timeMotLocGisWkt=getattr(segment_obj, "tml_giswkt", None),
         timeMotLocValidTime=getattr(segment_obj, "tml_valid", None),
@@ -253,10 +293,10 @@ def convert_text_product_segment_to_model(
         landspoutTag=getattr(segment_obj, "landspouttag", None),
         damageThreatTag=getattr(segment_obj, "damagetag", None),
         squallTag=getattr(segment_obj, "squalltag", None),
-        floodTags=dict(getattr(segment_obj, "flood_tags", {})),
+        floodTags=getattr(segment_obj, "flood_tags", {}),
         isEmergency=getattr(segment_obj, "is_emergency", False),
         isPDS=getattr(segment_obj, "is_pds", False),
-        bulletPoints=list(getattr(segment_obj, "bullets", [])),
+        bulletPoints=getattr(segment_obj, "bullets", []),
         affectedWfoList=affected_wfo_list,
         specialTagsText=special_tags_text or None,
     )
@@ -297,18 +337,19 @@ def convert_text_product_to_model(
         and all associated segments converted to their respective models.
 
     """
+    methods = _product_methods(product_obj)
+
     # TextProduct specific attributes and derived values
     product_id_val: str | None = None
     try:
         # get_product_id might fail if constituent parts (valid, afos, etc.) are None
-        if all(
-            [
-                getattr(product_obj, "valid", None),
-                getattr(product_obj, "source", None),
-                getattr(product_obj, "wmo", None),
-                getattr(product_obj, "afos", None),
-            ],
-        ) and hasattr(product_obj, "get_product_id"):
+        if (
+            getattr(product_obj, "valid", None)
+            and getattr(product_obj, "source", None)
+            and getattr(product_obj, "wmo", None)
+            and getattr(product_obj, "afos", None)
+            and methods.get_product_id
+        ):
             product_id_val = product_obj.get_product_id()
     except (AttributeError, TypeError, ValueError):
         product_id_val = None
@@ -318,7 +359,7 @@ def convert_text_product_to_model(
         {
             # WMOProduct base attributes
             "text": getattr(product_obj, "text", ""),
-            "warnings": list(getattr(product_obj, "warnings", [])),
+            "warnings": getattr(product_obj, "warnings", []),
             "source": getattr(product_obj, "source", None),
             "wmo": getattr(product_obj, "wmo", None),
             "ddhhmm": getattr(product_obj, "ddhhmm", None),
@@ -335,27 +376,17 @@ def convert_text_product_to_model(
             ],
             "geometry": getattr(product_obj, "geometry", None),
             "product_id": product_id_val,
-            "nicedate": product_obj.get_nicedate()
-            if hasattr(product_obj, "get_nicedate")
-            else None,
+            "nicedate": product_obj.get_nicedate() if methods.get_nicedate else None,
             "main_headline": (product_obj.get_main_headline() or None)
-            if hasattr(product_obj, "get_main_headline")
-            else None,
-            "signature": product_obj.get_signature()
-            if hasattr(product_obj, "get_signature")
+            if methods.get_main_headline
             else None,
+            "signature": product_obj.get_signature() if methods.get_signature else None,
             "channels": product_obj.get_channels()
-            if hasattr(product_obj, "get_channels") and getattr(product_obj, "afos", None)
-            else [],
-            "is_correction": product_obj.is_correction()
-            if hasattr(product_obj, "is_correction")
-            else None,
-            "is_resent": product_obj.is_resent() if hasattr(product_obj, "is_resent") else None,
-            "attn_wfo": product_obj.parse_attn_wfo()
-            if hasattr(product_obj, "parse_attn_wfo")
-            else [],
-            "attn_rfc": product_obj.parse_attn_rfc()
-            if hasattr(product_obj, "parse_attn_rfc")
+            if methods.get_channels and getattr(product_obj, "afos", None)
             else [],
+            "is_correction": product_obj.is_correction() if methods.is_correction else None,
+            "is_resent": product_obj.is_resent() if methods.is_resent else None,
+            "attn_wfo": product_obj.parse_attn_wfo() if methods.parse_attn_wfo else [],
+            "attn_rfc": product_obj.parse_attn_rfc() if methods.parse_attn_rfc else [],
         },
     )
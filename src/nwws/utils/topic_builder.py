@@ -1,5 +1,7 @@
 """Builds MQTT topics for NOAA port events based on configuration."""
 
+from __future__ import annotations
+
 from nwws.models.events import TextProductEventData, XmlEventData
 
 DEFAULT_TOPIC_PATTERN = "{prefix}/{cccc}/{product_type}/{awipsid}/{product_id}"
@@ -60,6 +62,12 @@ def build_topic(
     # Use AWIPS ID or default if not available
     awipsid = event.awipsid if event.awipsid else "GENERAL"
 
+    # Default pattern is a plain slash-joined path, skip the format machinery
+    if pattern is None:
+        cccc = event.cccc.strip()
+        product_id = event.id.strip()
+        return f"{prefix}/{cccc}/{product_type}/{awipsid.strip()}/{product_id}"
+
     # Build topic components dictionary for pattern substitution
     topic_components = {
         "prefix": prefix,
@@ -71,4 +79,4 @@ def build_topic(
     }
 
     # Format topic using configured pattern
-    return (pattern or DEFAULT_TOPIC_PATTERN).format(**topic_components)
+    return pattern.format(**topic_components)
@@ -194,7 +194,7 @@ class TestDuplicateFilter:
         assert result is True
         assert len(filter_instance._seen_products) == 0
 
-    @patch("time.time")
+    @patch("time.monotonic")
     def test_cleanup_expired_entries(
         self, mock_time: MagicMock, test_event_with_id: NoaaPortEventData
     ) -> None:
@@ -232,7 +232,7 @@ class TestDuplicateFilter:
         assert "DIFFERENT_ID" in filter_instance._seen_products
         assert test_event_with_id.id not in filter_instance._seen_products
 
-    @patch("time.time")
+    @patch("time.monotonic")
     def test_allows_same_id_after_window_expires(
         self, mock_time: MagicMock, test_event_with_id: NoaaPortEventData
     ) -> None:
@@ -279,7 +279,7 @@ class TestDuplicateFilter:
         assert stats["window_seconds"] == 300.0
         assert stats["oldest_entry_age"] >= 0.1
 
-    @patch("time.time")
+    @patch("time.monotonic")
     def test_multiple_cleanup_cycles(
         self, mock_time: MagicMock, test_event_with_id: NoaaPortEventData
     ) -> None:
@@ -331,6 +331,36 @@ class TestDuplicateFilter:
         # Should have 3 entries: last 2 original (at 1090, 1120) + new one
         assert len(filter_instance._seen_products) == 3
 
+    @patch("time.monotonic")
+    def test_cleanup_only_pops_expired_entries(
+        self, mock_time: MagicMock, test_event_with_id: NoaaPortEventData
+    ) -> None:
+        """Test that cleanup stops at the first unexpired entry."""
+        mock_time.return_value = 1000.0
+        filter_instance = DuplicateFilter(window_seconds=100.0)
+        filter_instance.should_process(test_event_with_id)
+
+        mock_time.return_value = 1050.0
+        event2 = NoaaPortEventData(
+            metadata=test_event_with_id.metadata,
+            awipsid="AFDALY",
+            cccc="KALY",
+            id="SECOND_ID",
+            issue=datetime.fromisoformat("2023-07-12T12:00:00+00:00"),
+            noaaport="Test content",
+            subject="Test Subject",
+            ttaaii="SXUS44",
+            delay_stamp=None,
+            content_type="text/plain",
+        )
+        filter_instance.should_process(event2)
+        assert len(filter_instance._seen_products) == 2
+
+        # Only the first entry has aged out of the window
+        filter_instance._cleanup_expired_entries(1120.0)
+
+        assert list(filter_instance._seen_products.items()) == [("SECOND_ID", 1050.0)]
+
     def test_concurrent_same_id_processing(
         self, test_event_with_id: NoaaPortEventData, second_event_with_same_id: NoaaPortEventData
     ) -> None:
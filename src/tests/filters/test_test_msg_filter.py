@@ -5,13 +5,14 @@ from __future__ import annotations
 
 import time
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from nwws.filters.test_msg_filter import TestMessageFilter
+from nwws.filters.test_msg_filter import TestMessageFilter, is_test_message
 from nwws.models.events import NoaaPortEventData
 from nwws.pipeline import PipelineEvent, PipelineEventMetadata, PipelineStage
+from nwws.logging_config import LoggingConfig
 
 
 @pytest.fixture
@@ -232,4 +233,29 @@ class TestTestMessageFilter:
         
         filter_instance = TestMessageFilter()
         result = filter_instance.should_process(event)
-        assert result is True
\ No newline at end of file
+        assert result is True
+
+    def test_call_skips_decision_metadata_when_debug_disabled(
+        self, test_message_event: NoaaPortEventData
+    ) -> None:
+        """Test that decision metadata is only built when debug logging is enabled."""
+        filter_instance = TestMessageFilter()
+        decision_metadata = MagicMock(return_value={})
+        filter_instance.get_filter_decision_metadata = decision_metadata  # type: ignore[method-assign]
+
+        with patch.object(LoggingConfig, "is_debug_enabled", return_value=False):
+            assert filter_instance(test_message_event) is False
+        decision_metadata.assert_not_called()
+
+        with patch.object(LoggingConfig, "is_debug_enabled", return_value=True):
+            assert filter_instance(test_message_event) is False
+        decision_metadata.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("awipsid", "expected"),
+    [("TSTMSG", True), ("tstmsg", True), ("MYTSTMSG", False), ("AFDBOX", False), ("", False)],
+)
+def test_is_test_message(awipsid: str, *, expected: bool) -> None:
+    """Test the shared test message check used by the filter and ingest pre-filter."""
+    assert is_test_message(awipsid) is expected
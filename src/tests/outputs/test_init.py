@@ -36,3 +36,19 @@ class TestOutputsPackage:
         config = MQTTConfig()
         output = MQTTOutput(config=config)
         assert output.output_id == "mqtt"
+
+    def test_database_output_lazy_import(self) -> None:
+        """Test that DatabaseOutput resolves lazily from the package."""
+        import nwws.outputs
+        from nwws.outputs.database import DatabaseOutput
+
+        assert nwws.outputs.DatabaseOutput is DatabaseOutput
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown package attributes raise AttributeError."""
+        import pytest
+
+        import nwws.outputs
+
+        with pytest.raises(AttributeError):
+            _ = nwws.outputs.NotAnOutput  # type: ignore[attr-defined]
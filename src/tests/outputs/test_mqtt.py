@@ -4,6 +4,16 @@
 from unittest.mock import Mock, patch
 from unittest.mock import MagicMock
 
+import pytest
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.reasoncodes import ReasonCode
+
+CONNACK_SUCCESS = ReasonCode(PacketTypes.CONNACK, "Success")
+CONNACK_REFUSED = ReasonCode(PacketTypes.CONNACK, "Not authorized")
+DISCONNECT_NORMAL = ReasonCode(PacketTypes.DISCONNECT, "Normal disconnection")
+PUBACK_SUCCESS = ReasonCode(PacketTypes.PUBACK, "Success")
+
+
 class TestMqttConfig:
     """Test cases for MqttConfig."""
 
@@ -41,6 +51,14 @@ class TestMqttConfig:
         assert config.mqtt_qos == 2
         assert config.mqtt_client_id == "custom-client"
 
+    def test_config_rejects_non_positive_ack_batch_size(self) -> None:
+        """Test MqttConfig rejects an ack batch size that would stall every send."""
+        from nwws.outputs.mqtt import MQTTConfig
+        for batch_size in ("0", "-1"):
+            with patch.dict("os.environ", {"MQTT_ACK_BATCH_SIZE": batch_size}):
+                with pytest.raises(ValueError, match="ack batch size"):
+                    MQTTConfig.from_env()
+
 
 class TestMQTTOutput:
     """Test cases for MQTTOutput."""
@@ -79,6 +97,8 @@ class TestMQTTOutput:
     @patch("nwws.outputs.mqtt.mqtt.Client")
     async def test_start_success(self, mock_client_class: Mock) -> None:
         """Test successful start operation."""
+        from paho.mqtt.enums import CallbackAPIVersion
+
         from nwws.outputs.mqtt import MQTTOutput, MQTTConfig
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
@@ -89,7 +109,10 @@ class TestMQTTOutput:
         await output.start()
 
         # Verify client was created and configured
-        mock_client_class.assert_called_once_with(client_id="nwws-oi-client")
+        mock_client_class.assert_called_once_with(
+            callback_api_version=CallbackAPIVersion.VERSION2,
+            client_id="nwws-oi-client",
+        )
         mock_client.loop_start.assert_called_once()
         mock_client.connect.assert_called_once_with("localhost", 1883, 60)
 
@@ -189,7 +212,7 @@ class TestMQTTOutput:
         output = MQTTOutput(config=config)
 
         # Simulate successful connection (rc=0)
-        output._on_connect(None, None, {}, 0)  # type: ignore[arg-type]
+        output._on_connect(None, None, {}, CONNACK_SUCCESS, None)  # type: ignore[arg-type]
 
         assert output._connected is True
 
@@ -200,7 +223,7 @@ class TestMQTTOutput:
         output = MQTTOutput(config=config)
 
         # Simulate failed connection (rc!=0)
-        output._on_connect(None, None, {}, 1)  # type: ignore[arg-type]
+        output._on_connect(None, None, {}, CONNACK_REFUSED, None)  # type: ignore[arg-type]
 
         assert output._connected is False
 
@@ -212,6 +235,109 @@ class TestMQTTOutput:
         output._connected = True
 
         # Simulate disconnection
-        output._on_disconnect(None, None, 0)  # type: ignore[arg-type]
+        output._on_disconnect(None, None, {}, DISCONNECT_NORMAL, None)  # type: ignore[arg-type]
 
         assert output._connected is False
+
+    def test_on_publish_before_tracking(self) -> None:
+        """Test an ack arriving before the mid is tracked is not left pending."""
+        from nwws.outputs.mqtt import MQTTOutput, MQTTConfig
+        config = MQTTConfig()
+        output = MQTTOutput(config=config)
+
+        output._on_publish(None, None, 7, PUBACK_SUCCESS, None)  # type: ignore[arg-type]
+        output._track_publish(7)
+        output._track_publish(8)
+
+        assert output._pending_mids == {8}
+        assert output._early_acks == set()
+
+    def test_on_connect_clears_early_acks(self) -> None:
+        """Test an early ack from a previous session cannot release a reused mid."""
+        from nwws.outputs.mqtt import MQTTOutput, MQTTConfig
+        config = MQTTConfig()
+        output = MQTTOutput(config=config)
+
+        output._on_publish(None, None, 1, PUBACK_SUCCESS, None)  # type: ignore[arg-type]
+        output._on_connect(None, None, {}, CONNACK_SUCCESS, None)  # type: ignore[arg-type]
+        output._track_publish(1)
+
+        assert output._pending_mids == {1}
+
+    async def test_send_waits_for_ack_batch(self) -> None:
+        """Test send applies backpressure once a full batch of acks is outstanding."""
+        import asyncio
+
+        from nwws.outputs.mqtt import MQTTOutput, MQTTConfig
+        config = MQTTConfig(mqtt_ack_batch_size=2)
+        output = MQTTOutput(config=config)
+        output._loop = asyncio.get_running_loop()
+        output._track_publish(1)
+        output._track_publish(2)
+
+        waiter = asyncio.create_task(output._wait_for_acks())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        output._on_publish(None, None, 1, PUBACK_SUCCESS, None)  # type: ignore[arg-type]
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert output._pending_mids == {2}
+
+    async def test_ack_wakeup_survives_other_waiter_leaving(self) -> None:
+        """Test a waiter is still woken after a concurrent waiter gives up."""
+        import asyncio
+
+        from nwws.outputs.mqtt import MQTTOutput, MQTTConfig
+        config = MQTTConfig(mqtt_ack_batch_size=2)
+        output = MQTTOutput(config=config)
+        output._loop = asyncio.get_running_loop()
+        output._track_publish(1)
+        output._track_publish(2)
+
+        first = asyncio.create_task(output._wait_for_acks())
+        second = asyncio.create_task(output._wait_for_acks())
+        await asyncio.sleep(0)
+        assert output._ack_waiters == 2
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert output._ack_waiters == 1
+
+        output._on_publish(None, None, 1, PUBACK_SUCCESS, None)  # type: ignore[arg-type]
+        await asyncio.wait_for(second, timeout=1)
+
+        assert output._ack_waiters == 0
+
+    def test_on_publish_skips_wakeup_without_waiter(self) -> None:
+        """Test acks do not hop to the event loop when nothing awaits them."""
+        from nwws.outputs.mqtt import MQTTOutput, MQTTConfig
+        config = MQTTConfig()
+        output = MQTTOutput(config=config)
+        output._loop = MagicMock()
+        output._track_publish(1)
+
+        output._on_publish(None, None, 1, PUBACK_SUCCESS, None)  # type: ignore[arg-type]
+
+        output._loop.call_soon_threadsafe.assert_not_called()
+
+    @patch("nwws.outputs.mqtt.logger")
+    @patch("nwws.outputs.mqtt.isinstance")
+    async def test_send_when_not_connected_rate_limits_warning(
+        self, mock_isinstance: Mock, mock_logger: Mock
+    ) -> None:
+        """Test dropped publishes are counted and warned about at most once a second."""
+        from nwws.outputs.mqtt import MQTTOutput, MQTTConfig
+        mock_isinstance.return_value = True
+
+        output = MQTTOutput(config=MQTTConfig())
+        mock_event = Mock()
+        mock_event.metadata.event_id = "test-event-123"
+
+        await output.send(mock_event)
+        await output.send(mock_event)
+        await output.send(mock_event)
+
+        assert output._dropped_count == 3
+        mock_logger.warning.assert_called_once()
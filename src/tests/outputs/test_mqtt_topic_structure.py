@@ -8,7 +8,7 @@ from nwws.models.weather import TextProductModel, TextProductSegmentModel, VTECM
 from nwws.outputs.mqtt import MQTTOutput, MQTTConfig
 from nwws.pipeline import PipelineEventMetadata
 from nwws.utils import build_topic
-from nwws.utils.topic_builder import get_product_type_indicator
+from nwws.utils.topic_builder import DEFAULT_TOPIC_PATTERN, get_product_type_indicator
 
 
 from typing import List, Optional, Dict, TypedDict
@@ -176,6 +176,20 @@ class TestMQTTTopicStructure:
         expected = "nwws/KPHI/GENERAL/GENERAL/202307131700-KPHI-UNKNOWN"
         assert result == expected
 
+    def test_build_topic_default_pattern_matches_explicit_pattern(self) -> None:
+        """Test the default topic fast path matches formatting the default pattern."""
+        event = self.create_mock_event(
+            cccc=" KDMX ",
+            awipsid="AFDDMX",
+            product_id="202307131830-KDMX-FXUS63-AFDDMX"
+        )
+
+        assert build_topic(event) == build_topic(event, pattern=DEFAULT_TOPIC_PATTERN)
+        assert (
+            build_topic(event, pattern="{prefix}/{awipsid}/{content_type}")
+            == "nwws/AFDDMX/text/plain"
+        )
+
     def test_filtering_scenarios(self) -> None:
         """Test various filtering scenarios that users might want."""
         class TestCaseFilterDict(TypedDict):
@@ -268,3 +282,19 @@ class TestMQTTTopicStructure:
         # Should use the first VTEC found (flood advisory)
         result = get_product_type_indicator(event)
         assert result == "FA.Y"
+
+    def test_product_json_serialized_once(self) -> None:
+        """Test that the product payload is serialized once and reused."""
+        event = self.create_mock_event()
+        serializer = MagicMock()
+        serializer.to_json.return_value = b'{"test": "data"}'
+        event.product.__pydantic_serializer__ = serializer  # type: ignore[misc]
+
+        topic = build_topic(event=event, prefix=self.config.mqtt_topic_prefix)
+        metadata = self.mqtt_output.get_output_metadata(event)
+
+        assert str(event) == '{"test": "data"}'
+        assert metadata["test_target_topic"] == topic
+        assert metadata["test_payload_size"] == len('{"test": "data"}')
+        assert event.product_json_bytes == b'{"test": "data"}'
+        serializer.to_json.assert_called_once()
@@ -210,6 +210,26 @@ class TestPipeline:
         # Should record failure stats
         mock_stats_collector.record_stage_error.assert_called()
 
+    async def test_process_event_single_output_error_not_grouped(
+        self,
+        pipeline_event: PipelineEvent,
+        mock_output: Mock,
+    ) -> None:
+        """Test that a single output failure propagates without an exception group."""
+        mock_output.side_effect = OSError("Send failed")
+
+        pipeline = Pipeline(
+            pipeline_id="test-pipeline",
+            outputs=[mock_output],
+        )
+
+        await pipeline.start()
+
+        with pytest.raises(OSError, match="Send failed"):
+            await pipeline.process(pipeline_event)
+
+        mock_output.assert_called_once()
+
     def test_get_stats_summary(self, mock_stats_collector: Mock) -> None:
         """Test getting stats summary."""
         pipeline = Pipeline(
@@ -269,6 +269,75 @@ class TestErrorHandler:
                 PipelineStage.OUTPUT, "output-1", failing_operation
             )
 
+    async def test_execute_with_retry_sync_operation(self) -> None:
+        """Test that non-async operations are called without awaiting the result."""
+        handler = PipelineErrorHandler()
+
+        def double(value: int) -> int:
+            return value * 2
+
+        result = await handler.execute_with_retry(PipelineStage.OUTPUT, "output-1", double, 21)
+        assert result == 42
+
+    async def test_execute_with_retry_fast_path_failure_recovers(self) -> None:
+        """Test that a first attempt failure is retried and cleared once it succeeds."""
+        handler = PipelineErrorHandler(
+            strategy=ErrorHandlingStrategy.RETRY,
+            max_retries=2,
+            retry_delay_seconds=0.0,
+        )
+        failing_keys = handler._failing_keys  # pyright: ignore[reportPrivateUsage]
+
+        call_count = 0
+
+        async def flaky_operation() -> str:
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                assert not failing_keys
+                raise OSError("Temporary failure")
+            assert failing_keys == {"output.output-1"}
+            return "success"
+
+        result = await handler.execute_with_retry(
+            PipelineStage.OUTPUT, "output-1", flaky_operation
+        )
+        assert result == "success"
+        assert call_count == 2
+        assert not failing_keys
+
+    async def test_execute_with_retry_circuit_breaker_recovers(self) -> None:
+        """Test that an open circuit rejects calls and closes after a success."""
+        handler = PipelineErrorHandler(
+            strategy=ErrorHandlingStrategy.CIRCUIT_BREAKER,
+            circuit_breaker_threshold=1,
+            circuit_breaker_timeout_seconds=0.0,
+        )
+
+        async def failing_operation() -> str:
+            raise OSError("Persistent failure")
+
+        async def successful_operation() -> str:
+            return "success"
+
+        # Healthy components leave no circuit breaker state behind
+        await handler.execute_with_retry(PipelineStage.OUTPUT, "output-1", successful_operation)
+        assert handler.get_error_summary()["circuit_breaker_states"] == {}
+
+        with pytest.raises(OSError, match="Persistent failure"):
+            await handler.execute_with_retry(PipelineStage.OUTPUT, "output-1", failing_operation)
+        state = handler.get_error_summary()["circuit_breaker_states"]["output.output-1"]
+        assert state["state"] == "open"
+
+        # Timeout has elapsed, so the half-open circuit lets the call through and closes
+        result = await handler.execute_with_retry(
+            PipelineStage.OUTPUT, "output-1", successful_operation
+        )
+        assert result == "success"
+        state = handler.get_error_summary()["circuit_breaker_states"]["output.output-1"]
+        assert state["state"] == "closed"
+        assert state["failure_count"] == 0
+
     def test_error_summary(self) -> None:
         """Test error summary generation."""
         handler = PipelineErrorHandler()
@@ -2,14 +2,20 @@
 """Tests for pipeline transformers."""
 
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
+from nwws.models.events import TextProductEventData
+from nwws.models.weather.product import TextProductModel
 from nwws.pipeline.errors import TransformerError
 from nwws.pipeline.transformers import (
+    AttributeTransformer,
     ChainTransformer,
     PassThroughTransformer,
+    PropertyTransformer,
     Transformer,
     TransformerConfig,
     TransformerRegistry,
@@ -356,3 +362,69 @@ class TestChainTransformerFactory:
         assert transformer.transformers[0].transformer_id == "noaaport"
         assert isinstance(transformer.transformers[1], XmlTransformer)
         assert transformer.transformers[1].transformer_id == "xml"
+
+
+def _make_product(payload: bytes) -> MagicMock:
+    """Create a mock text product that serializes to the given JSON bytes."""
+    product = MagicMock(spec=TextProductModel)
+    serializer = MagicMock()
+    serializer.to_json.return_value = payload
+    product.__pydantic_serializer__ = serializer
+    return product
+
+
+def _make_text_product_event(product: MagicMock) -> TextProductEventData:
+    """Create a text product event wrapping the given product."""
+    return TextProductEventData(
+        metadata=PipelineEventMetadata(source="test", stage=PipelineStage.TRANSFORM),
+        product=product,
+        awipsid="AFDBOX",
+        cccc="KBOX",
+        id="test-id",
+        issue=datetime(2023, 7, 12, 12, 0, tzinfo=UTC),
+        noaaport="Test content",
+        subject="Test Subject",
+        ttaaii="FXUS61",
+        delay_stamp=None,
+        content_type="text/plain",
+    )
+
+
+class TestSerializedEventCopies:
+    """Test that copying or rebuilding a serialized event does not reuse stale JSON."""
+
+    @pytest.mark.parametrize("transformer_cls", [AttributeTransformer, PropertyTransformer])
+    def test_transform_serialized_event(
+        self, transformer_cls: type[AttributeTransformer] | type[PropertyTransformer]
+    ) -> None:
+        """Test that an event can be rebuilt by a transformer after it was serialized."""
+        event = _make_text_product_event(_make_product(b'{"old": true}'))
+        assert str(event) == '{"old": true}'
+
+        new_product = _make_product(b'{"new": true}')
+
+        def replace_product(_product: object) -> MagicMock:
+            return new_product
+
+        transformer = transformer_cls("replace-product", {"product": replace_product})
+        result = transformer.transform(event)
+
+        assert isinstance(result, TextProductEventData)
+        assert result.product_json_bytes == b'{"new": true}'
+        assert str(result) == '{"new": true}'
+
+    def test_with_stage_copy_reserializes_replaced_product(self) -> None:
+        """Test that a stage copy whose product is replaced does not keep the old JSON."""
+        original_product = _make_product(b'{"old": true}')
+        event = _make_text_product_event(original_product)
+        assert event.product_json == '{"old": true}'
+
+        event_copy = event.with_stage(PipelineStage.OUTPUT)
+        assert isinstance(event_copy, TextProductEventData)
+        assert event_copy.product_json == '{"old": true}'
+
+        event_copy.product = _make_product(b'{"new": true}')
+        assert event_copy.product_json == '{"new": true}'
+        assert event.product_json == '{"old": true}'
+        cache = event._product_json_cache  # pyright: ignore[reportPrivateUsage]
+        assert cache[0] is original_product
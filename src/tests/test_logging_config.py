@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 from loguru import logger
 
-from nwws.utils.logging_config import LoggingConfig
+from nwws.logging_config import LoggingConfig
 
 
 class TestLoggingConfig:
@@ -213,6 +213,20 @@ class TestLoggingConfig:
             # If not visible, that's OK as long as logging didn't crash
             pass
 
+    def test_is_debug_enabled_follows_configured_level(self) -> None:
+        """Test debug detection reflects the configured handler level."""
+        with redirect_stdout(io.StringIO()):
+            LoggingConfig.configure("INFO")
+        assert not LoggingConfig.is_debug_enabled()
+
+        LoggingConfig.reset()
+        with redirect_stdout(io.StringIO()):
+            LoggingConfig.configure("DEBUG")
+        assert LoggingConfig.is_debug_enabled()
+
+        LoggingConfig.reset()
+        assert not LoggingConfig.is_debug_enabled()
+
     def test_reset_functionality(self) -> None:
         """Test that reset properly clears configuration state."""
         LoggingConfig.configure("DEBUG", "/tmp/test.log")
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import datetime
+from typing import TYPE_CHECKING, cast
 from unittest.mock import MagicMock
 
 from nwws.models.weather import (
@@ -14,6 +15,7 @@ from nwws.models.weather import (
     VTECModel,
 )
 from nwws.utils.converters import (
+    _PRODUCT_METHODS_CACHE,  # pyright: ignore[reportPrivateUsage]
     convert_hvtec_to_model,
     convert_text_product_segment_to_model,
     convert_text_product_to_model,
@@ -21,6 +23,9 @@ from nwws.utils.converters import (
     convert_vtec_to_model,
 )
 
+if TYPE_CHECKING:
+    from pyiem.nws.product import TextProduct
+
 
 class TestConvertUGCToModel:
     """Test convert_ugc_to_model function."""
@@ -477,3 +482,36 @@ class TestConvertTextProductToModel:
 
         assert isinstance(result, TextProductModel)
         assert result.channels == []  # Should be empty due to missing afos
+
+    def test_convert_product_caches_method_probes_per_type(self) -> None:
+        """Test accessor availability is probed once per product class."""
+
+        class Product:
+            text = "TEXT"
+            warnings: list[str] = []
+            source = None
+            wmo = None
+            ddhhmm = None
+            bbb = None
+            valid = None
+            wmo_valid = None
+            utcnow = datetime.datetime(2023, 7, 12, 12, 0, 0)
+            z = None
+            afos = None
+            segments: list[object] = []
+            geometry = None
+
+            def get_signature(self) -> str:
+                return "Forecaster Smith"
+
+        convert_text_product_to_model(cast("TextProduct", Product()))
+        methods = _PRODUCT_METHODS_CACHE[Product]
+        assert methods.get_signature
+        assert not methods.get_nicedate
+
+        result = convert_text_product_to_model(cast("TextProduct", Product()))
+
+        assert _PRODUCT_METHODS_CACHE[Product] is methods
+        assert result.signature == "Forecaster Smith"
+        assert result.nicedate is None
+        assert result.attn_wfo == []